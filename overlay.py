@@ -4,22 +4,26 @@ Desktop widget showing hardware temperatures and usage.
 Sits on the desktop layer — above wallpaper, below all app windows.
 Requires admin privileges to read hardware sensors.
 """
+import bisect
+import concurrent.futures
 import ctypes
-import math
-import re
 import ctypes.wintypes
+import functools
+import io
 import json
 import locale
 import logging
 import logging.handlers
+import math
 import os
+import re
 import subprocess
 import sys
 import threading
 import time
 import tkinter as tk
+import wave
 import winreg
-import winsound
 import xml.etree.ElementTree as ET
 
 import psutil
@@ -79,6 +83,15 @@ SENSOR_STATUS_PARTIAL = "partial"
 SENSOR_STATUS_WARMING_UP = "warming_up"
 SENSOR_STATUS_DRIVER_MISSING = "driver_missing"
 SENSOR_WARMUP_SECONDS = 60
+SENSOR_POLL_SECONDS = 2
+# Wait after the Nth consecutive read failure: 2, 4, 8 ... 256 s, then capped at 300 s.
+SENSOR_ERROR_BACKOFF_SECONDS = tuple(min(300, SENSOR_POLL_SECONDS * 2 ** n) for n in range(9))
+UI_POLL_MS = 250  # update_ui tick; redraws only when a new sample has been published
+SENSOR_UPDATE_WORKERS = 4
+CONFIG_SAVE_DEBOUNCE_SECONDS = 0.5
+SENSOR_INDEX_REFRESH_SECONDS = 300  # re-walk the LHM tree in case sensors appear late
+SLIDE_PX_PER_SECOND = 2000  # peek slide speed (the former 20 px per 10 ms step)
+SLIDE_FRAME_MS = 10
 STATUS_CONFIG_SAVE_ERROR = "config_save_error"
 STATUS_CONFIG_ADJUSTED = "config_adjusted"
 CONFIG_STATUSES = (STATUS_CONFIG_SAVE_ERROR, STATUS_CONFIG_ADJUSTED)
@@ -117,6 +130,7 @@ user32.SetWindowPos.argtypes = [
     ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
     ctypes.c_uint,
 ]
+user32.SetWindowPos.restype = ctypes.wintypes.BOOL
 user32.FindWindowW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
 user32.FindWindowW.restype = ctypes.wintypes.HWND
 user32.SendMessageTimeoutW.argtypes = [
@@ -125,11 +139,15 @@ user32.SendMessageTimeoutW.argtypes = [
     ctypes.POINTER(ctypes.wintypes.DWORD),
 ]
 user32.SendMessageTimeoutW.restype = ctypes.wintypes.LPARAM
-user32.EnumWindows.argtypes = [ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM), ctypes.wintypes.LPARAM]
+_WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM)
+user32.EnumWindows.argtypes = [_WNDENUMPROC, ctypes.wintypes.LPARAM]
+user32.EnumWindows.restype = ctypes.wintypes.BOOL
 user32.FindWindowExW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.HWND, ctypes.c_wchar_p, ctypes.c_wchar_p]
 user32.FindWindowExW.restype = ctypes.wintypes.HWND
 user32.SetParent.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.HWND]
 user32.SetParent.restype = ctypes.wintypes.HWND
+user32.IsWindow.argtypes = [ctypes.wintypes.HWND]
+user32.IsWindow.restype = ctypes.wintypes.BOOL
 
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
@@ -147,6 +165,48 @@ GA_PARENT = 1
 user32.GetWindowThreadProcessId.argtypes = [ctypes.wintypes.HWND, ctypes.POINTER(ctypes.wintypes.DWORD)]
 user32.GetWindowThreadProcessId.restype = ctypes.wintypes.DWORD
 _MY_PID = os.getpid()
+_DESKTOP_CLASSES = frozenset(("Progman", "WorkerW"))
+# Reused by _is_desktop_hwnd; only ever touched from the Tk thread.
+_CLASS_NAME_BUFFER = ctypes.create_unicode_buffer(256)
+
+# WinEvent hooks: foreground, move/size-end and minimize events are the
+# changes that can reveal or cover the desktop behind the widget. Each range
+# gets its own hook; one 0x03..0x17 range would also deliver capture, menu,
+# scroll, drag-drop and dialog events, i.e. a callback per click anywhere.
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_SYSTEM_MINIMIZESTART = 0x0016
+EVENT_SYSTEM_MINIMIZEEND = 0x0017
+_DESKTOP_EVENT_RANGES = (
+    (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND),
+    (EVENT_SYSTEM_MOVESIZEEND, EVENT_SYSTEM_MOVESIZEEND),
+    (EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND),
+)
+WINEVENT_OUTOFCONTEXT = 0x0000
+_WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.LONG,
+    ctypes.wintypes.LONG,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+)
+user32.SetWinEventHook.argtypes = [
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HMODULE,
+    _WINEVENTPROC,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+]
+user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+# Safety net for changes that raise no such event; 4 x 500 ms polls.
+DESKTOP_RECHECK_TICKS = 4
 
 # Virtual screen metrics (all monitors combined)
 SM_XVIRTUALSCREEN = 76
@@ -156,9 +216,30 @@ SM_CYVIRTUALSCREEN = 79
 user32.GetSystemMetrics.argtypes = [ctypes.c_int]
 user32.GetSystemMetrics.restype = ctypes.c_int
 
+
+def _virtual_screen_rect():
+    """Return (x, y, width, height) of the virtual screen spanning all monitors."""
+    metrics = user32.GetSystemMetrics
+    return (
+        metrics(SM_XVIRTUALSCREEN),
+        metrics(SM_YVIRTUALSCREEN),
+        metrics(SM_CXVIRTUALSCREEN),
+        metrics(SM_CYVIRTUALSCREEN),
+    )
+
+
 # --- Desktop widget: embed window into the desktop layer ---
+_WORKERW_CACHE = None  # stable until explorer.exe restarts; revalidated with IsWindow
+
+
 def find_desktop_worker_w():
     """Find the WorkerW window behind desktop icons for widget embedding."""
+    global _WORKERW_CACHE
+    cached = _WORKERW_CACHE
+    if cached and user32.IsWindow(cached):
+        return cached
+    _WORKERW_CACHE = None
+
     progman = user32.FindWindowW("Progman", None)
     if not progman:
         return None
@@ -169,16 +250,20 @@ def find_desktop_worker_w():
 
     worker_w = None
 
-    @ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM)
+    @_WNDENUMPROC
     def enum_callback(hwnd, lparam):
         nonlocal worker_w
         shell_view = user32.FindWindowExW(hwnd, 0, "SHELLDLL_DefView", None)
         if shell_view:
             # The WorkerW we want is the NEXT one after the one containing SHELLDLL_DefView
             worker_w = user32.FindWindowExW(0, hwnd, "WorkerW", None)
+            if worker_w:
+                return False  # found it; stop enumerating the remaining top-level windows
         return True
 
     user32.EnumWindows(enum_callback, 0)
+    if worker_w:
+        _WORKERW_CACHE = worker_w
     return worker_w
 
 
@@ -353,18 +438,28 @@ def is_autostart_enabled():
     return matches
 
 
+_legacy_autostart_cleared = False
+
+
 def _delete_legacy_autostart_value():
+    """Remove the pre-Task-Scheduler Run value; the key is opened at most once per run."""
+    global _legacy_autostart_cleared
+    if _legacy_autostart_cleared:
+        return True, "legacy registry entry already cleared"
     try:
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _LEGACY_REG_KEY, 0, winreg.KEY_SET_VALUE) as key:
             try:
                 winreg.DeleteValue(key, AUTOSTART_TASK)
             except FileNotFoundError:
-                return True, "legacy registry entry not present"
+                message = "legacy registry entry not present"
+            else:
+                message = "legacy registry entry removed"
     except FileNotFoundError:
-        return True, "legacy registry key not present"
+        message = "legacy registry key not present"
     except OSError as e:
         return False, f"failed to remove legacy registry entry: {e}"
-    return True, "legacy registry entry removed"
+    _legacy_autostart_cleared = True
+    return True, message
 
 
 def enable_autostart():
@@ -446,14 +541,22 @@ def _check_lhm_cpu_temperature(computer, HardwareType, SensorType):
         )
 
 
+_hw_dll_loaded = False  # assembly loads are process-wide; reinit reuses the loaded DLL
+
+
 def init_hardware_monitor():
     """Initialize LibreHardwareMonitor via pythonnet."""
+    global _hw_dll_loaded
+    # Check the DLL before importing pythonnet: loading the .NET runtime is the
+    # expensive part and is wasted when the psutil fallback is all we can use.
+    dll_path = os.path.join(LIB_DIR, "LibreHardwareMonitorLib.dll")
+    if not os.path.exists(dll_path):
+        return None
     try:
         import clr  # pythonnet
-        dll_path = os.path.join(LIB_DIR, "LibreHardwareMonitorLib.dll")
-        if not os.path.exists(dll_path):
-            return None
-        clr.AddReference(dll_path)
+        if not _hw_dll_loaded:
+            clr.AddReference(dll_path)
+            _hw_dll_loaded = True
         from LibreHardwareMonitor.Hardware import Computer
 
         computer = Computer()
@@ -483,27 +586,37 @@ def _safe_round(value):
     return round(v)
 
 
+_SENSOR_DATA_TEMPLATE = {
+    "cpu_temp": None,
+    "cpu_load": None,
+    "cpu_clock": None,
+    "gpu_temp": None,
+    "gpu_load": None,
+    "gpu_clock": None,
+    "cpu_fan": None,
+    "cpu_fan_pct": None,
+    "gpu_fan": None,
+    "gpu_fan_pct": None,
+    "gpu_vram_pct": None,
+    "gpu_vram_used_gb": None,
+    "gpu_vram_total_gb": None,
+    "ram_pct": None,
+    "ram_used_gb": None,
+    "ram_total_gb": None,
+    "motherboard_temps": None,
+    "disks": None,
+}
+
+
 def _empty_sensor_data():
-    return {
-        "cpu_temp": None,
-        "cpu_load": None,
-        "cpu_clock": None,
-        "gpu_temp": None,
-        "gpu_load": None,
-        "gpu_clock": None,
-        "cpu_fan": None,
-        "cpu_fan_pct": None,
-        "gpu_fan": None,
-        "gpu_fan_pct": None,
-        "gpu_vram_pct": None,
-        "gpu_vram_used_gb": None,
-        "gpu_vram_total_gb": None,
-        "ram_pct": None,
-        "ram_used_gb": None,
-        "ram_total_gb": None,
-        "motherboard_temps": [],
-        "disks": [],
-    }
+    # Samples are published by reference and never mutated afterwards, so each
+    # poll needs its own dict (a reused double buffer could be rewritten while
+    # update_ui is still drawing it). Copying a template clones the key table
+    # in one step instead of inserting every key.
+    data = _SENSOR_DATA_TEMPLATE.copy()
+    data["motherboard_temps"] = []
+    data["disks"] = []
+    return data
 
 
 def _empty_peak_data():
@@ -548,8 +661,11 @@ def _iter_hardware_sensors(hw, include_subhardware=False):
                 yield sensor
 
 
+_FAN_NUMBER_RE = re.compile(r"#\s*(\d+)|fan\s*#?\s*(\d+)")
+
+
 def _fan_number(name):
-    match = re.search(r"#\s*(\d+)|fan\s*#?\s*(\d+)", name)
+    match = _FAN_NUMBER_RE.search(name)
     if not match:
         return None
     return match.group(1) or match.group(2)
@@ -591,8 +707,12 @@ def _select_cpu_fan_control(control_sensors, fan_name, has_cpu_fan):
     return None
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=512)
 def _normalized_sensor_name(name):
-    return re.sub(r"\s+", " ", str(name).replace("_", " ").lower()).strip()
+    return _WHITESPACE_RE.sub(" ", str(name).replace("_", " ").lower()).strip()
 
 
 def _is_gpu_load_sensor(name):
@@ -606,14 +726,16 @@ def _is_gpu_load_sensor(name):
     )
 
 
-def _is_gpu_memory_used_sensor(name):
-    name = _normalized_sensor_name(name)
-    return "memory" in name and "used" in name and "shared" not in name
-
-
-def _is_gpu_memory_total_sensor(name):
+def _gpu_memory_role(name):
+    """Return "used"/"total" for dedicated GPU memory SmallData sensors, else None."""
     name = _normalized_sensor_name(name)
-    return "memory" in name and "total" in name and "shared" not in name
+    if "memory" not in name or "shared" in name:
+        return None
+    if "used" in name:
+        return "used"
+    if "total" in name:
+        return "total"
+    return None
 
 
 def _is_ram_load_sensor(name):
@@ -621,117 +743,363 @@ def _is_ram_load_sensor(name):
     return name in ("memory", "memory load", "physical memory", "physical memory load")
 
 
-def _read_hardware_block(hw, HardwareType, SensorType, data, update_storage=True):
-    hw_type = hw.HardwareType
+class _LhmKinds:
+    """LHM enum members resolved once, so the per-sensor loop compares plain attributes."""
+
+    __slots__ = (
+        "hardware_type", "sensor_type",
+        "cpu", "gpu_amd", "gpu_nvidia", "gpu_intel", "gpus", "storage", "motherboard", "memory",
+        "read_types",
+        "temperature", "load", "clock", "fan", "control", "small_data", "level",
+    )
+
+    def __init__(self, HardwareType, SensorType):
+        self.hardware_type = HardwareType
+        self.sensor_type = SensorType
+        self.cpu = HardwareType.Cpu
+        self.gpu_amd = HardwareType.GpuAmd
+        self.gpu_nvidia = HardwareType.GpuNvidia
+        self.gpu_intel = HardwareType.GpuIntel
+        self.gpus = (self.gpu_amd, self.gpu_nvidia, self.gpu_intel)
+        self.storage = HardwareType.Storage
+        self.motherboard = HardwareType.Motherboard
+        self.memory = HardwareType.Memory
+        self.read_types = frozenset((self.cpu, *self.gpus, self.storage, self.motherboard, self.memory))
+        self.temperature = SensorType.Temperature
+        self.load = SensorType.Load
+        self.clock = SensorType.Clock
+        self.fan = SensorType.Fan
+        self.control = SensorType.Control
+        self.small_data = SensorType.SmallData
+        self.level = SensorType.Level
+
+
+_lhm_kinds_cache = None
+
+
+def _lhm_kinds(HardwareType, SensorType):
+    global _lhm_kinds_cache
+    kinds = _lhm_kinds_cache
+    if kinds is None or kinds.hardware_type is not HardwareType or kinds.sensor_type is not SensorType:
+        kinds = _lhm_kinds_cache = _LhmKinds(HardwareType, SensorType)
+    return kinds
+
+
+_CPU_TEMP_HINTS = ("tctl", "tdie", "package")
+_DISK_VENDOR_RE = re.compile(
+    r"^(Samsung|WDC|Western Digital|Kingston|Crucial|Seagate|Toshiba|SK Hynix|Intel|Micron|SanDisk|ADATA|Corsair)\s*(SSD\s*)?",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _disk_display_name(name):
+    """Strip the vendor prefix from a drive model; names are stable, so cache them."""
+    return _DISK_VENDOR_RE.sub("", name).strip() or name
+
+
+class _HardwareEntry:
+    """Cached LHM topology for one hardware item.
+
+    ``sensors``/``sub_sensors`` hold ``(sensor, sensor_type, name, lowered_name)``
+    handles so the per-poll loop only crosses the CLR bridge for ``Update()``
+    and ``Value``, and never re-lowers a name.
+    They stay ``None`` until the first ``Update()``, since LHM may activate
+    sensors lazily, and are dropped again when the hardware reports a sensor
+    added or removed (see ``_SensorIndex``). ``plan`` memoizes the name matching for CPU/GPU blocks:
+    only the sensors that feed a field, each tagged with its role.
+    """
+
+    __slots__ = ("hw", "hw_type", "name", "subs", "sensors", "sub_sensors", "plan")
+
+    def __init__(self, hw):
+        self.hw = hw
+        self.hw_type = hw.HardwareType
+        self.name = str(hw.Name)
+        self.subs = tuple(getattr(hw, "SubHardware", ()))
+        self.sensors = None
+        self.sub_sensors = None
+        self.plan = None
+
+    def invalidate_sensors(self):
+        # The plan is derived from the handles, so it goes stale with them.
+        self.sensors = None
+        self.sub_sensors = None
+        self.plan = None
+
+    def load_sensors(self):
+        self.plan = None
+        self.sensors = _sensor_handles(getattr(self.hw, "Sensors", ()))
+        self.sub_sensors = self.sensors + tuple(
+            handle
+            for sub in self.subs
+            for handle in _sensor_handles(getattr(sub, "Sensors", ()))
+        )
+
+
+def _sensor_handles(sensors):
+    handles = []
+    for sensor in sensors:
+        name = str(sensor.Name)
+        handles.append((sensor, sensor.SensorType, name, name.lower()))
+    return tuple(handles)
+
+
+def _cpu_sensor_plan(handles, kinds):
+    plan = []
+    for sensor, sensor_type, sensor_name, name in handles:
+        if sensor_type == kinds.temperature:
+            preferred = any(hint in name for hint in _CPU_TEMP_HINTS)
+            role = "temp_preferred" if preferred else "temp"
+        elif sensor_type == kinds.load and "total" in name:
+            role = "load"
+        elif sensor_type == kinds.clock and "core" in name:
+            role = "clock"
+        else:
+            continue
+        plan.append((sensor, role))
+    return tuple(plan)
+
+
+def _gpu_sensor_plan(handles, kinds):
+    """Roles are the ``sensor_data`` keys, except the two VRAM inputs."""
+    plan = []
+    for sensor, sensor_type, sensor_name, name in handles:
+        if sensor_type == kinds.temperature:
+            if "core" not in name and "gpu" not in name:
+                continue
+            role = "gpu_temp"
+        elif sensor_type == kinds.load:
+            if not _is_gpu_load_sensor(sensor_name):
+                continue
+            role = "gpu_load"
+        elif sensor_type == kinds.fan:
+            role = "gpu_fan"
+        elif sensor_type == kinds.control:
+            role = "gpu_fan_pct"
+        elif sensor_type == kinds.clock:
+            if "core" not in name:
+                continue
+            role = "gpu_clock"
+        elif sensor_type == kinds.small_data:
+            memory_role = _gpu_memory_role(sensor_name)
+            if memory_role is None:
+                continue
+            role = "vram_" + memory_role
+        else:
+            continue
+        plan.append((sensor, role))
+    return tuple(plan)
+
+
+class _SensorIndex:
+    """Hardware entries cached per Computer instance.
+
+    Rebuilt when LHM reports hardware added/removed, and periodically as a
+    fallback for sensors that appear without such an event. Per-entry sensor
+    handles are reloaded when a hardware item reports SensorAdded/Removed,
+    which is how LHM announces sensors it activates on a later Update().
+    """
+
+    __slots__ = ("computer", "entries", "built_at", "_subscribed", "_sensor_handlers")
+
+    def __init__(self):
+        self.computer = None
+        self.entries = None
+        self.built_at = 0.0
+        self._subscribed = None
+        self._sensor_handlers = ()
+
+    def get(self, computer):
+        now = time.monotonic()
+        if (
+            self.entries is None
+            or self.computer is not computer
+            or now - self.built_at >= SENSOR_INDEX_REFRESH_SECONDS
+        ):
+            return None
+        return self.entries
+
+    def store(self, computer, entries):
+        self._unwatch_sensors()
+        self.computer = computer
+        self.entries = entries
+        self.built_at = time.monotonic()
+        if self._subscribed is not computer:
+            self._subscribe(computer)
+        self._watch_sensors(entries)
+
+    def _watch_sensors(self, entries):
+        watched = []
+        for entry in entries:
+            def on_sensor_changed(*_args, entry=entry):
+                # The next _read_hardware_block reloads the handles and plan.
+                entry.invalidate_sensors()
+
+            for hw in (entry.hw, *entry.subs):
+                try:
+                    hw.SensorAdded += on_sensor_changed
+                    hw.SensorRemoved += on_sensor_changed
+                except Exception:
+                    log.debug("LHM sensor change events unavailable for %s", _hardware_label(hw), exc_info=True)
+                watched.append((hw, on_sensor_changed))
+        self._sensor_handlers = tuple(watched)
+
+    def _unwatch_sensors(self):
+        # Entries are replaced wholesale, so detach the old handlers from the
+        # (often identical) hardware objects instead of stacking new ones.
+        for hw, handler in self._sensor_handlers:
+            try:
+                hw.SensorAdded -= handler
+                hw.SensorRemoved -= handler
+            except Exception:
+                log.debug("Failed to detach LHM sensor change events", exc_info=True)
+        self._sensor_handlers = ()
+
+    def _subscribe(self, computer):
+        def on_hardware_changed(*_args):
+            # Events from an old (closed) Computer must not drop the new index.
+            if self.computer is computer:
+                self.entries = None
+
+        try:
+            computer.HardwareAdded += on_hardware_changed
+            computer.HardwareRemoved += on_hardware_changed
+        except Exception:
+            log.debug("LHM hardware change events unavailable; relying on periodic refresh", exc_info=True)
+        self._subscribed = computer
+
+
+def _update_hardware(entry):
+    entry.hw.Update()
+    for sub in entry.subs:
+        sub.Update()
+
+
+def _update_hardware_parallel(entries, kinds, update_storage, pool):
+    """Run Update() for independent hardware on `pool`.
+
+    Returns (updated, failed): entries whose Update() finished, and a map of
+    entry -> exception. The Intel iGPU is left to the serial pass because
+    whether it is read at all depends on the discrete GPU's sample.
+    """
+    batch = [
+        entry for entry in entries
+        if entry.hw_type in kinds.read_types
+        and entry.hw_type != kinds.gpu_intel
+        and (update_storage or entry.hw_type != kinds.storage)
+    ]
+    if len(batch) < 2:
+        return set(), {}
+    futures = [(entry, pool.submit(_update_hardware, entry)) for entry in batch]
+    updated = set()
+    failed = {}
+    for entry, future in futures:
+        error = future.exception()
+        if error is None:
+            updated.add(entry)
+        else:
+            failed[entry] = error
+    return updated, failed
+
+
+def _read_hardware_block(entry, kinds, data, update_storage=True, updated=False):
+    hw_type = entry.hw_type
+    # Hardware we never read (network, PSU, controllers...) is not worth an Update().
+    if hw_type not in kinds.read_types:
+        return
     # Skip intentionally ignored iGPU before touching its driver-backed sensors.
-    if hw_type == HardwareType.GpuIntel and data["gpu_temp"] is not None:
+    if hw_type == kinds.gpu_intel and data["gpu_temp"] is not None:
         return
-    is_storage = hw_type == HardwareType.Storage
-    if is_storage and not update_storage:
-        # Skip Update() but still read cached sensor values
+    is_storage = hw_type == kinds.storage
+    if updated or (is_storage and not update_storage):
+        # Already updated in parallel, or storage skip: read cached sensor values
         pass
     else:
-        hw.Update()
-        for sub in hw.SubHardware:
-            sub.Update()
-
-    if hw_type == HardwareType.Cpu:
+        _update_hardware(entry)
+    if entry.sensors is None:
+        entry.load_sensors()
+
+    ST_TEMPERATURE = kinds.temperature
+    ST_LOAD = kinds.load
+    ST_FAN = kinds.fan
+    ST_CONTROL = kinds.control
+
+    if hw_type == kinds.cpu:
+        plan = entry.plan
+        if plan is None:
+            plan = entry.plan = _cpu_sensor_plan(entry.sub_sensors, kinds)
         core_clocks = []
-        for sensor in _iter_hardware_sensors(hw, include_subhardware=True):
-            if sensor.SensorType == SensorType.Temperature:
-                name = sensor.Name.lower()
+        for sensor, role in plan:
+            if role == "clock":
+                val = _safe_round(sensor.Value)
+                if val is not None and val > 0:
+                    core_clocks.append(val)
+            elif role == "load":
+                val = _safe_round(sensor.Value)
+                if val is not None:
+                    data["cpu_load"] = val
+            else:
+                # Per-core temps only fill an empty slot; skip the Value fetch otherwise.
+                if role == "temp" and data["cpu_temp"] is not None:
+                    continue
                 val = _safe_round(sensor.Value)
                 if val is not None and val > 0:  # 0°C = driver failure
-                    if "tctl" in name or "tdie" in name or "package" in name:
-                        data["cpu_temp"] = val
-                    elif data["cpu_temp"] is None:
-                        data["cpu_temp"] = val
-            elif sensor.SensorType == SensorType.Load:
-                if "total" in sensor.Name.lower():
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        data["cpu_load"] = val
-            elif sensor.SensorType == SensorType.Clock:
-                if "core" in sensor.Name.lower():
-                    val = _safe_round(sensor.Value)
-                    if val is not None and val > 0:
-                        core_clocks.append(val)
+                    data["cpu_temp"] = val
         if core_clocks:
             data["cpu_clock"] = round(max(core_clocks))
 
-    elif hw_type in (HardwareType.GpuAmd, HardwareType.GpuNvidia, HardwareType.GpuIntel):
+    elif hw_type in kinds.gpus:
         gpu_mem_used = None
         gpu_mem_total = None
-        sensors = list(hw.Sensors)
-        if not sensors:
+        if not entry.sensors:
             data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PARTIAL
             data[SENSOR_REINIT_KEY] = True
-        for sensor in sensors:
-            if sensor.SensorType == SensorType.Temperature:
-                if "core" in sensor.Name.lower() or "gpu" in sensor.Name.lower():
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        data["gpu_temp"] = val
-            elif sensor.SensorType == SensorType.Load:
-                if _is_gpu_load_sensor(sensor.Name):
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        data["gpu_load"] = val
-            elif sensor.SensorType == SensorType.Fan:
-                val = _safe_round(sensor.Value)
-                if val is not None:
-                    data["gpu_fan"] = val
-            elif sensor.SensorType == SensorType.Control:
-                val = _safe_round(sensor.Value)
-                if val is not None:
-                    data["gpu_fan_pct"] = val
-            elif sensor.SensorType == SensorType.Clock:
-                if "core" in sensor.Name.lower():
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        data["gpu_clock"] = val
-            elif sensor.SensorType == SensorType.SmallData:
-                if _is_gpu_memory_used_sensor(sensor.Name):
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        gpu_mem_used = float(sensor.Value)
-                elif _is_gpu_memory_total_sensor(sensor.Name):
-                    val = _safe_round(sensor.Value)
-                    if val is not None:
-                        gpu_mem_total = float(sensor.Value)
+        plan = entry.plan
+        if plan is None:
+            plan = entry.plan = _gpu_sensor_plan(entry.sensors, kinds)
+        for sensor, role in plan:
+            value = sensor.Value
+            val = _safe_round(value)
+            if val is None:
+                continue
+            if role == "vram_used":
+                gpu_mem_used = float(value)
+            elif role == "vram_total":
+                gpu_mem_total = float(value)
+            else:
+                data[role] = val
         if gpu_mem_used is not None and gpu_mem_total and gpu_mem_total > 0:
             data["gpu_vram_pct"] = round(gpu_mem_used / gpu_mem_total * 100)
             data["gpu_vram_used_gb"] = round(gpu_mem_used / 1024, 1)
             data["gpu_vram_total_gb"] = round(gpu_mem_total / 1024, 1)
 
-    elif hw_type == HardwareType.Storage:
+    elif is_storage:
+        ST_LEVEL = kinds.level
         disk_temp = None
         disk_used = None
         disk_life = None
-        for sensor in hw.Sensors:
-            if sensor.SensorType == SensorType.Temperature:
+        for sensor, sensor_type, sensor_name, name in entry.sensors:
+            if sensor_type == ST_TEMPERATURE:
                 if disk_temp is None:
                     disk_temp = _safe_round(sensor.Value)
-            elif sensor.SensorType == SensorType.Load:
-                if "used space" in sensor.Name.lower():
+            elif sensor_type == ST_LOAD:
+                if "used space" in name:
                     val = _safe_round(sensor.Value)
                     if val is not None:
                         disk_used = val
-            elif sensor.SensorType == SensorType.Level:
-                name = sensor.Name.lower()
-                val = _safe_round(sensor.Value)
-                if val is not None:
-                    if name == "life" or "remaining life" in name:
+            elif sensor_type == ST_LEVEL:
+                if name == "life" or "remaining life" in name:
+                    val = _safe_round(sensor.Value)
+                    if val is not None:
                         disk_life = val
-                    elif "percentage used" in name and disk_life is None:
+                elif "percentage used" in name and disk_life is None:
+                    val = _safe_round(sensor.Value)
+                    if val is not None:
                         disk_life = max(0, min(100, 100 - val))
         # Always show storage devices — even without sensors
-        name = re.sub(
-            r"^(Samsung|WDC|Western Digital|Kingston|Crucial|Seagate|Toshiba|SK Hynix|Intel|Micron|SanDisk|ADATA|Corsair)\s*(SSD\s*)?",
-            "", str(hw.Name), flags=re.IGNORECASE,
-        ).strip() or str(hw.Name)
         disk_data = {
-            "name": name,
+            "name": _disk_display_name(entry.name),
             "temp": disk_temp,
             "used_pct": disk_used,
         }
@@ -739,24 +1107,23 @@ def _read_hardware_block(hw, HardwareType, SensorType, data, update_storage=True
             disk_data["life_pct"] = disk_life
         data["disks"].append(disk_data)
 
-    elif hw_type == HardwareType.Motherboard:
+    elif hw_type == kinds.motherboard:
         fan_sensors = []
         control_sensors = []
-        for sensor in _iter_hardware_sensors(hw, include_subhardware=True):
-            name = sensor.Name.lower()
-            if sensor.SensorType == SensorType.Fan:
+        for sensor, sensor_type, sensor_name, name in entry.sub_sensors:
+            if sensor_type == ST_FAN:
                 val = _safe_round(sensor.Value)
                 if val is not None:
                     fan_sensors.append((name, val))
-            elif sensor.SensorType == SensorType.Control:
+            elif sensor_type == ST_CONTROL:
                 val = _safe_round(sensor.Value)
                 if val is not None:
                     control_sensors.append((name, val))
-            elif sensor.SensorType == SensorType.Temperature:
+            elif sensor_type == ST_TEMPERATURE:
                 val = _safe_round(sensor.Value)
                 if val is not None:
                     data["motherboard_temps"].append({
-                        "name": str(sensor.Name),
+                        "name": sensor_name,
                         "temp": val,
                     })
         if data["cpu_fan"] is None:
@@ -773,22 +1140,29 @@ def _read_hardware_block(hw, HardwareType, SensorType, data, update_storage=True
                 data["cpu_fan"] is not None,
             )
 
-    elif hw_type == HardwareType.Memory:
-        for sensor in hw.Sensors:
-            if sensor.SensorType == SensorType.Load:
-                if _is_ram_load_sensor(sensor.Name):
+    elif hw_type == kinds.memory:
+        for sensor, sensor_type, sensor_name, name in entry.sensors:
+            if sensor_type == ST_LOAD:
+                if _is_ram_load_sensor(sensor_name):
                     val = _safe_round(sensor.Value)
                     if val is not None:
                         data["ram_pct"] = val
 
 
-def read_sensors(computer, update_storage=True):
+def read_sensors(computer, update_storage=True, index=None, update_pool=None):
     """Read all temperature and load sensors from hardware.
 
     Args:
         computer: LibreHardwareMonitor Computer instance (or None for psutil fallback).
         update_storage: If False, skip hw.Update() for storage devices to reduce I/O.
                         Disk data will retain previous values from the last full update.
+        index: Optional _SensorIndex that caches the hardware/sensor topology
+               between calls. Without it the tree is walked on every call.
+        update_pool: Optional executor used to run independent hw.Update()
+                     calls concurrently before the (serial) sensor pass.
+
+    Always returns a freshly built dict (including the disk dicts); callers may
+    publish it to other threads without copying.
     """
     data = _empty_sensor_data()
 
@@ -803,64 +1177,106 @@ def read_sensors(computer, update_storage=True):
         data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PSUTIL_FALLBACK
         return _apply_psutil_fallbacks(data)
 
-    try:
-        hardware_items = list(computer.Hardware)
-    except Exception:
-        log.warning("Failed to enumerate LibreHardwareMonitor hardware, falling back to psutil", exc_info=True)
-        data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PSUTIL_FALLBACK
-        return _apply_psutil_fallbacks(data)
-
-    for hw in hardware_items:
+    entries = index.get(computer) if index is not None else None
+    if entries is None:
+        try:
+            hardware_items = list(computer.Hardware)
+        except Exception:
+            log.warning("Failed to enumerate LibreHardwareMonitor hardware, falling back to psutil", exc_info=True)
+            data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PSUTIL_FALLBACK
+            return _apply_psutil_fallbacks(data)
+        entries = []
+        complete = True
+        for hw in hardware_items:
+            try:
+                entries.append(_HardwareEntry(hw))
+            except Exception:
+                complete = False
+                data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PARTIAL
+                log.warning("Skipping hardware block after sensor read failure: %s", _hardware_label(hw), exc_info=True)
+        # Only cache a complete topology; a partial walk is retried next poll.
+        if index is not None and complete:
+            index.store(computer, entries)
+
+    kinds = _lhm_kinds(HardwareType, SensorType)
+    updated, failed = set(), {}
+    if update_pool is not None:
+        updated, failed = _update_hardware_parallel(entries, kinds, update_storage, update_pool)
+    for entry in entries:
         try:
-            _read_hardware_block(hw, HardwareType, SensorType, data, update_storage=update_storage)
+            error = failed.get(entry)
+            if error is not None:
+                raise error
+            _read_hardware_block(entry, kinds, data, update_storage=update_storage, updated=entry in updated)
         except Exception:
             data[SENSOR_STATUS_KEY] = SENSOR_STATUS_PARTIAL
-            log.warning("Skipping hardware block after sensor read failure: %s", _hardware_label(hw), exc_info=True)
+            log.warning("Skipping hardware block after sensor read failure: %s", _hardware_label(entry.hw), exc_info=True)
 
     _apply_psutil_fallbacks(data)
 
     return data
 
 
+class _AlertThresholds:
+    """Critical alert levels; slotted so _check_alerts reads plain attributes."""
+
+    __slots__ = ("cpu_temp", "gpu_temp", "disk_temp", "disk_used", "ram_pct")
+
+    def __init__(self, cpu_temp, gpu_temp, disk_temp, disk_used, ram_pct):
+        self.cpu_temp = cpu_temp
+        self.gpu_temp = gpu_temp
+        self.disk_temp = disk_temp
+        self.disk_used = disk_used
+        self.ram_pct = ram_pct
+
+
 # --- Color coding ---
-def temp_color(temp):
-    if temp is None:
+_COLOR_LUT_SIZE = 151  # sensor values are rounded ints; covers 0..150 °C / %
+
+
+_LEVEL_COLORS = ("#4ade80", "#facc15", "#f87171")  # ok, warn, crit
+
+
+def _build_color_lut(thresholds):
+    return tuple(
+        _LEVEL_COLORS[bisect.bisect_right(thresholds, value)]
+        for value in range(_COLOR_LUT_SIZE)
+    )
+
+
+def _lut_color(value, lut, thresholds):
+    if value is None:
         return "#888888"
-    if temp < 55:
-        return "#4ade80"
-    if temp < 75:
-        return "#facc15"
-    return "#f87171"
+    if value.__class__ is int and 0 <= value < _COLOR_LUT_SIZE:
+        return lut[value]
+    # Floats and out-of-range values: one bisect over (warn, crit).
+    return _LEVEL_COLORS[bisect.bisect_right(thresholds, value)]
+
+
+_TEMP_THRESHOLDS = (55, 75)
+_DISK_TEMP_THRESHOLDS = (45, 55)
+_LOAD_THRESHOLDS = (50, 80)
+_DISK_USAGE_THRESHOLDS = (70, 85)
+_TEMP_COLOR_LUT = _build_color_lut(_TEMP_THRESHOLDS)
+_DISK_TEMP_COLOR_LUT = _build_color_lut(_DISK_TEMP_THRESHOLDS)
+_LOAD_COLOR_LUT = _build_color_lut(_LOAD_THRESHOLDS)
+_DISK_USAGE_COLOR_LUT = _build_color_lut(_DISK_USAGE_THRESHOLDS)
+
+
+def temp_color(temp):
+    return _lut_color(temp, _TEMP_COLOR_LUT, _TEMP_THRESHOLDS)
 
 
 def disk_temp_color(temp):
-    if temp is None:
-        return "#888888"
-    if temp < 45:
-        return "#4ade80"
-    if temp < 55:
-        return "#facc15"
-    return "#f87171"
+    return _lut_color(temp, _DISK_TEMP_COLOR_LUT, _DISK_TEMP_THRESHOLDS)
 
 
 def load_color(load):
-    if load is None:
-        return "#888888"
-    if load < 50:
-        return "#4ade80"
-    if load < 80:
-        return "#facc15"
-    return "#f87171"
+    return _lut_color(load, _LOAD_COLOR_LUT, _LOAD_THRESHOLDS)
 
 
 def disk_usage_color(pct):
-    if pct is None:
-        return "#888888"
-    if pct < 70:
-        return "#4ade80"
-    if pct < 85:
-        return "#facc15"
-    return "#f87171"
+    return _lut_color(pct, _DISK_USAGE_COLOR_LUT, _DISK_USAGE_THRESHOLDS)
 
 
 def _format_rpm(value):
@@ -877,6 +1293,9 @@ def _format_vram_gb(used_gb, total_gb):
     return f"{used_gb:.1f}/{total_gb:.1f}G"
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _short_board_temp_name(name):
     lowered = str(name).lower()
     if "vrm" in lowered:
@@ -887,7 +1306,7 @@ def _short_board_temp_name(name):
         return "SYS"
     if "cpu" in lowered:
         return "CPU"
-    cleaned = re.sub(r"[^a-z0-9]+", "", lowered)
+    cleaned = _NON_ALNUM_RE.sub("", lowered)
     return (cleaned[:4] or "TEMP").upper()
 
 
@@ -1023,6 +1442,14 @@ def build_sensor_diagnostics(computer, sensor_data=None, is_admin=None, pawnio_i
     lines.append("Hardware inventory:")
     for hw in hardware_items:
         lines.append(f"Hardware: {_hardware_label(hw)}")
+        # read_sensors skips Update() for types the overlay never shows
+        # (network, PSU, controllers...); the dump should have their values.
+        try:
+            hw.Update()
+            for sub in getattr(hw, "SubHardware", ()):
+                sub.Update()
+        except Exception as e:
+            lines.append(f"  update failed: {e}")
         sensors = list(_iter_hardware_sensors(hw, include_subhardware=True))
         if not sensors:
             lines.append("  no sensors")
@@ -1045,35 +1472,50 @@ def _default_config():
             "gpu_fan_max_rpm": 2200, "cpu_fan_max_rpm": 1800}
 
 
+_INVALID_CONFIG_VALUE = object()
+
+
+def _config_position(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return _INVALID_CONFIG_VALUE
+    return int(value)
+
+
+def _config_flag(value):
+    return value if isinstance(value, bool) else _INVALID_CONFIG_VALUE
+
+
+def _config_rpm(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return _INVALID_CONFIG_VALUE
+    return int(value)
+
+
+# Validated config keys and their coercers, in the order problems are reported.
+_CONFIG_FIELDS = (
+    ("x", _config_position),
+    ("y", _config_position),
+    ("peek_enabled", _config_flag),
+    ("alerts_enabled", _config_flag),
+    ("details_enabled", _config_flag),
+    ("gpu_fan_max_rpm", _config_rpm),
+    ("cpu_fan_max_rpm", _config_rpm),
+)
+
+
 def _normalize_config(cfg, defaults):
     invalid_keys = []
-    provided_keys = set(cfg)
     normalized = dict(defaults)
     normalized.update(cfg)
-    for key in ("x", "y"):
-        if key not in provided_keys:
-            continue
-        value = normalized.get(key)
-        if isinstance(value, bool) or not isinstance(value, (int, float)):
-            normalized[key] = defaults[key]
-            invalid_keys.append(key)
-        else:
-            normalized[key] = int(value)
-    for key in ("peek_enabled", "alerts_enabled", "details_enabled"):
-        if key not in provided_keys:
-            continue
-        if not isinstance(normalized.get(key), bool):
-            normalized[key] = defaults[key]
-            invalid_keys.append(key)
-    for key in ("gpu_fan_max_rpm", "cpu_fan_max_rpm"):
-        if key not in provided_keys:
+    for key, coerce in _CONFIG_FIELDS:
+        if key not in cfg:
             continue
-        value = normalized.get(key)
-        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        value = coerce(cfg[key])
+        if value is _INVALID_CONFIG_VALUE:
             normalized[key] = defaults[key]
             invalid_keys.append(key)
         else:
-            normalized[key] = int(value)
+            normalized[key] = value
     return normalized, invalid_keys
 
 
@@ -1127,8 +1569,10 @@ def load_config():
 def save_config(cfg):
     tmp_path = f"{CONFIG_PATH}.tmp"
     try:
+        # Serialize in one call and write once; compact separators keep it small.
+        payload = json.dumps(cfg, separators=(",", ":"))
         with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(cfg, f)
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, CONFIG_PATH)
@@ -1167,6 +1611,31 @@ def is_pawnio_driver_installed():
         return True
 
 
+# --- Alert sound ---
+# winmm directly: winsound refuses SND_ASYNC together with SND_MEMORY.
+winmm = ctypes.windll.winmm
+winmm.PlaySoundW.argtypes = [ctypes.c_void_p, ctypes.wintypes.HMODULE, ctypes.wintypes.DWORD]
+winmm.PlaySoundW.restype = ctypes.wintypes.BOOL
+SND_ASYNC = 0x0001
+SND_NODEFAULT = 0x0002
+SND_MEMORY = 0x0004
+
+
+def _make_alert_wav(freq=1000, tone_ms=300, gap_ms=150, reps=2, rate=22050):
+    """Build an in-memory 8-bit mono WAV of `reps` sine beeps separated by silence."""
+    tone_frames = rate * tone_ms // 1000
+    step = 2 * math.pi * freq / rate
+    tone = bytes(128 + int(96 * math.sin(step * i)) for i in range(tone_frames))
+    gap = b"\x80" * (rate * gap_ms // 1000)  # 8-bit PCM silence is the midpoint
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(1)
+        wav.setframerate(rate)
+        wav.writeframes(gap.join([tone] * reps))
+    return buf.getvalue()
+
+
 # --- Main overlay class ---
 class OverlayApp:
     def __init__(self):
@@ -1182,6 +1651,10 @@ class OverlayApp:
             else None
         )
         self._sensor_start_time = time.monotonic()
+        # Worker threads start lazily, so this costs nothing in psutil fallback mode.
+        self._update_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=SENSOR_UPDATE_WORKERS, thread_name_prefix="lhm-update",
+        )
         self._sensor_status = (
             SENSOR_STATUS_PSUTIL_FALLBACK
             if self.computer is None
@@ -1190,26 +1663,38 @@ class OverlayApp:
         self.running = True
         self._stop_event = threading.Event()
         self.sensor_data = {}
-        self.lock = threading.Lock()
+        self._rendered_data = None  # snapshot last drawn by update_ui
+        self.lock = threading.Lock()  # guards computer/running; sensor_data is swapped lock-free
         self.embedded = False
         self._embed_scheduled = False
+        self._after_ids = set()  # pending after() ids, cancelled in quit
 
         # --- Alert system ---
         self.alerts_enabled = self.config.get("alerts_enabled", True)
         self.details_enabled = self.config.get("details_enabled", False)
         self._last_alert_time = 0
         self._ALERT_COOLDOWN = 60  # seconds between repeated alerts
-        self._CRITICAL = {
-            "cpu_temp": 85,
-            "gpu_temp": 90,
-            "disk_temp": 55,
-            "disk_used": 90,
-            "ram_pct": 95,
-        }
+        # ctypes buffer kept for the app's lifetime: async PlaySound reads it while playing.
+        self._alert_wav = ctypes.create_string_buffer(_make_alert_wav())
+        critical = self._CRITICAL = _AlertThresholds(
+            cpu_temp=85,
+            gpu_temp=90,
+            disk_temp=55,
+            disk_used=90,
+            ram_pct=95,
+        )
+        # (data key, threshold, label, unit) checked on every tick by _check_alerts
+        self._alert_specs = (
+            ("cpu_temp", critical.cpu_temp, "CPU", "°C"),
+            ("gpu_temp", critical.gpu_temp, "GPU", "°C"),
+            ("ram_pct", critical.ram_pct, "RAM", "%"),
+        )
         # Max RPM for fan % estimation (auto-calibrated, persisted in config)
         self._GPU_FAN_MAX_RPM = self.config.get("gpu_fan_max_rpm", 2200)
         self._CPU_FAN_MAX_RPM = self.config.get("cpu_fan_max_rpm", 1800)
-        self._config_save_pending = False
+        self._config_save_pending = False  # 30 s fan-calibration flush
+        self._drag_save_pending = False  # short end_drag debounce flush
+        self._last_config_save = 0.0
         self.peaks = _empty_peak_data()
 
         # --- tkinter setup ---
@@ -1231,6 +1716,9 @@ class OverlayApp:
         self._drag_x = 0
         self._drag_y = 0
         self._dragged = False
+        self._drag_pos = None
+        self._pending_geom = None
+        self._drag_scheduled = False
 
         # --- Header ---
         header = tk.Frame(self.root, bg="#16213e", cursor="fleur")
@@ -1268,6 +1756,7 @@ class OverlayApp:
 
         # Create label rows in color-coded groups
         self.rows = {}
+        self._label_state = {}  # row key -> last (text, fg) pushed to Tk
 
         # CPU group — temp + clock + load as three separate colored values
         cpu_row = tk.Frame(self.content, bg="#1a1a2e")
@@ -1354,8 +1843,10 @@ class OverlayApp:
                            font=("Segoe UI", 9))
         self._menu_idx = {}  # label_key -> menu index
         self._add_menu_item("topmost", "Always on top: OFF", self.toggle_topmost)
+        # schtasks /Query spawns a process; query once and keep the result.
+        self._autostart_state = is_autostart_enabled()
         self._add_menu_item("autostart",
-            "Autostart: ON" if is_autostart_enabled() else "Autostart: OFF",
+            "Autostart: ON" if self._autostart_state else "Autostart: OFF",
             self.toggle_autostart)
         self._add_menu_item("alerts",
             "Alerts: ON" if self.alerts_enabled else "Alerts: OFF",
@@ -1375,6 +1866,7 @@ class OverlayApp:
         self.menu.add_separator()
         self.menu.add_command(label="Close", command=self.quit)
         self.root.bind("<Button-3>", self.show_menu)
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
 
         # --- Peek from edge ---
         self.peek_visible = False
@@ -1383,7 +1875,7 @@ class OverlayApp:
         self._create_peek_trigger()
 
         # --- Embed into desktop after window is drawn ---
-        self.root.after(100, self._embed_into_desktop)
+        self._after(100, self._embed_into_desktop)
 
         # --- Start sensor thread ---
         self.sensor_thread = threading.Thread(target=self.sensor_loop, daemon=True)
@@ -1407,10 +1899,7 @@ class OverlayApp:
         if getattr(self, "peek_visible", False) or getattr(self, "_peek_animating", False):
             return False
         self.root.update_idletasks()
-        virt_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        virt_y = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-        virt_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-        virt_h = user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+        virt_x, virt_y, virt_w, virt_h = _virtual_screen_rect()
         x, y = _clamp_overlay_position(
             self.config.get("x", 50),
             self.config.get("y", 50),
@@ -1446,10 +1935,12 @@ class OverlayApp:
                 self.status_label.pack_forget()
                 self._status_label_visible = False
             return
-        self.status_label.config(
-            text=STATUS_TEXT.get(status, ""),
-            fg=STATUS_COLOR.get(status, "#facc15"),
-        )
+        if getattr(self, "_status_label_status", None) != status:
+            self.status_label.config(
+                text=STATUS_TEXT.get(status, ""),
+                fg=STATUS_COLOR.get(status, "#facc15"),
+            )
+            self._status_label_status = status
         if not getattr(self, "_status_label_visible", False):
             self.status_label.pack(fill="x", pady=(2, 0))
             self._status_label_visible = True
@@ -1471,6 +1962,7 @@ class OverlayApp:
         self._refresh_runtime_status()
 
     def _save_config(self, update_status=True):
+        self._last_config_save = time.monotonic()
         ok, message = save_config(self.config)
         if update_status and getattr(self, "running", False):
             self._set_config_status(None if ok else STATUS_CONFIG_SAVE_ERROR)
@@ -1526,7 +2018,15 @@ class OverlayApp:
             self.details_frame.pack_forget()
 
     def _get_hwnd(self):
-        """Get the native Windows HWND for the tkinter root window."""
+        """Get the native Windows HWND for the tkinter root window.
+
+        The frame HWND is stable for the window's lifetime (SetParent does not
+        change it), so resolve it once instead of forcing update_idletasks on
+        every peek/embed transition.
+        """
+        cached = getattr(self, "_hwnd", None)
+        if cached:
+            return cached
         self.root.update_idletasks()
         frame_id = self.root.wm_frame()
         if frame_id:
@@ -1535,6 +2035,7 @@ class OverlayApp:
             except (ValueError, TypeError):
                 hwnd = 0
             if hwnd and hwnd != 0:
+                self._hwnd = hwnd
                 return hwnd
         return self.root.winfo_id()
 
@@ -1556,7 +2057,7 @@ class OverlayApp:
         """Schedule _embed_into_desktop with dedup guard."""
         if not self._embed_scheduled:
             self._embed_scheduled = True
-            self.root.after(delay, self._embed_into_desktop)
+            self._after(delay, self._embed_into_desktop)
 
     def _make_row(self, key, label_text, parent=None, label_fg="#a0a0c0"):
         parent = parent or self.content
@@ -1622,20 +2123,39 @@ class OverlayApp:
             self._trigger.withdraw()
 
         # Periodically re-check screen geometry for resolution/monitor changes
-        self._last_screen_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        self._last_screen_y = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-        self._last_screen_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-        self._last_screen_h = user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+        self._last_screen_rect = _virtual_screen_rect()
         self._trigger_hidden_for_desktop = False
+        self._install_desktop_event_hook()
         self._poll_screen_change()
         self._poll_trigger_visibility()
 
+    def _install_desktop_event_hook(self):
+        """Mark the desktop hit-test dirty whenever windows change focus, move or minimize."""
+        self._desktop_dirty = True
+        self._desktop_check_ticks = 0
+
+        def _on_win_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            self._desktop_dirty = True
+
+        # Out-of-context events are delivered on this (Tk) thread via its message loop.
+        self._win_event_proc = _WINEVENTPROC(_on_win_event)  # must outlive the hooks
+        hooks = []
+        for event_min, event_max in _DESKTOP_EVENT_RANGES:
+            hook = user32.SetWinEventHook(
+                event_min, event_max, 0,
+                self._win_event_proc, 0, 0, WINEVENT_OUTOFCONTEXT,
+            )
+            if hook:
+                hooks.append(hook)
+            else:
+                log.debug("SetWinEventHook failed for events 0x%02X..0x%02X", event_min, event_max)
+        self._win_event_hooks = tuple(hooks)
+        if not hooks:
+            log.debug("No WinEvent hooks installed; checking desktop visibility every poll")
+
     def _update_trigger_geometry(self):
         """Position the trigger strip on the right edge of the virtual screen (all monitors)."""
-        virt_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        virt_y = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-        virt_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-        virt_h = user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+        virt_x, virt_y, virt_w, virt_h = _virtual_screen_rect()
         trigger_w = 6
         self._trigger.geometry(f"{trigger_w}x{virt_h}+{virt_x + virt_w - trigger_w}+{virt_y}")
 
@@ -1643,34 +2163,41 @@ class OverlayApp:
         """Re-position trigger strip if screen geometry changed (resolution or monitor rearrangement)."""
         if not self.running:
             return
-        screen_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        screen_y = user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
-        screen_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
-        screen_h = user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
-        if (screen_x != self._last_screen_x or screen_y != self._last_screen_y
-                or screen_w != self._last_screen_w or screen_h != self._last_screen_h):
-            self._last_screen_x = screen_x
-            self._last_screen_y = screen_y
-            self._last_screen_w = screen_w
-            self._last_screen_h = screen_h
+        screen_rect = _virtual_screen_rect()
+        if screen_rect != self._last_screen_rect:
+            self._last_screen_rect = screen_rect
             self._update_trigger_geometry()
             self._clamp_saved_position_to_visible_screen(persist=True)
-        self.root.after(5000, self._poll_screen_change)
+        self._after(5000, self._poll_screen_change)
 
     def _poll_trigger_visibility(self):
         """Hide the peek trigger strip when the desktop is visible (widget already shown)."""
         if not self.running:
             return
         if self.peek_enabled and not self.topmost and not self.peek_visible and not self._peek_animating:
-            if self._is_desktop_at_widget():
-                if not self._trigger_hidden_for_desktop:
-                    self._trigger_hidden_for_desktop = True
-                    self._trigger.withdraw()
+            # Hit-test only after a window event, or periodically as a fallback.
+            ticks = getattr(self, "_desktop_check_ticks", 0) + 1
+            if (
+                not getattr(self, "_win_event_hooks", ())
+                or getattr(self, "_desktop_dirty", True)
+                or ticks >= DESKTOP_RECHECK_TICKS
+            ):
+                self._desktop_dirty = False
+                self._desktop_check_ticks = 0
+                if self._is_desktop_at_widget():
+                    if not self._trigger_hidden_for_desktop:
+                        self._trigger_hidden_for_desktop = True
+                        self._trigger.withdraw()
+                else:
+                    if self._trigger_hidden_for_desktop:
+                        self._trigger_hidden_for_desktop = False
+                        self._trigger.deiconify()
             else:
-                if self._trigger_hidden_for_desktop:
-                    self._trigger_hidden_for_desktop = False
-                    self._trigger.deiconify()
-        self.root.after(500, self._poll_trigger_visibility)
+                self._desktop_check_ticks = ticks
+        else:
+            # Peek/topmost state changed the layout; re-check once eligible again.
+            self._desktop_dirty = True
+        self._after(500, self._poll_trigger_visibility)
 
     def _is_desktop_at_cursor(self):
         """Hide trigger and check if desktop is under the cursor.
@@ -1684,6 +2211,7 @@ class OverlayApp:
         self._trigger.withdraw()
         self._trigger.update_idletasks()
         self._trigger_hidden_for_desktop = True  # poll will restore if needed
+        self._desktop_dirty = True
         hwnd = user32.WindowFromPoint(pt)
         return self._is_desktop_hwnd(hwnd)
 
@@ -1708,19 +2236,24 @@ class OverlayApp:
         if pid.value == _MY_PID:
             return True
         # Check window class for actual desktop windows
-        class_name = ctypes.create_unicode_buffer(256)
-        user32.GetClassName(hwnd, class_name, 256)
-        if class_name.value in ("Progman", "WorkerW"):
+        # Bind the foreign functions once; the parent walk below may call them
+        # up to 20 times per hit-test.
+        get_class_name = user32.GetClassName
+        get_ancestor = user32.GetAncestor
+        class_name = _CLASS_NAME_BUFFER
+        size = len(class_name)
+        get_class_name(hwnd, class_name, size)
+        if class_name.value in _DESKTOP_CLASSES:
             return True
         # Walk parent chain as fallback
         current = hwnd
         for _ in range(20):
-            parent = user32.GetAncestor(current, GA_PARENT)
+            parent = get_ancestor(current, GA_PARENT)
             if not parent or parent == current:
                 break
             current = parent
-            user32.GetClassName(current, class_name, 256)
-            if class_name.value in ("Progman", "WorkerW"):
+            get_class_name(current, class_name, size)
+            if class_name.value in _DESKTOP_CLASSES:
                 return True
         return False
 
@@ -1747,8 +2280,10 @@ class OverlayApp:
         # Make topmost
         self.root.wm_attributes("-topmost", True)
 
-        virt_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        virt_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
+        # One metrics read per peek; the 200 ms mouse poll and the slide-out
+        # reuse it (display changes mid-peek are picked up on the next peek).
+        self._peek_screen_rect = _virtual_screen_rect()
+        virt_x, _, virt_w, _ = self._peek_screen_rect
         screen_right = virt_x + virt_w
         try:
             self.root.update_idletasks()
@@ -1771,23 +2306,28 @@ class OverlayApp:
         self.root.update_idletasks()
 
         # Animate slide-in
-        self._animate_slide(screen_right, target_x, target_y, step=-20, callback=self._peek_shown)
+        self._animate_slide(screen_right, target_x, target_y, callback=self._peek_shown)
 
-    def _animate_slide(self, current_x, target_x, y, step, callback):
-        """Animate horizontal slide."""
+    def _animate_slide(self, start_x, target_x, y, callback):
+        """Animate horizontal slide at SLIDE_PX_PER_SECOND, independent of frame timing."""
+        duration = abs(target_x - start_x) / SLIDE_PX_PER_SECOND
+        # perf_counter: time.monotonic ticks at ~15.6 ms on Windows, coarser than a frame.
+        self._slide_state = (start_x, target_x, y, time.perf_counter(), duration, callback)
+        self._slide_step()
+
+    def _slide_step(self):
         if not self.running or not self._peek_animating:
             return
+        start_x, target_x, y, started, duration, callback = self._slide_state
         try:
-            if step < 0 and current_x <= target_x:
-                self.root.geometry(f"+{target_x}+{y}")
-                callback()
-                return
-            if step > 0 and current_x >= target_x:
+            elapsed = time.perf_counter() - started
+            if elapsed >= duration:
                 self.root.geometry(f"+{target_x}+{y}")
                 callback()
                 return
-            self.root.geometry(f"+{current_x}+{y}")
-            self.root.after(10, lambda: self._animate_slide(current_x + step, target_x, y, step, callback))
+            x = start_x + round((target_x - start_x) * elapsed / duration)
+            self.root.geometry(f"+{x}+{y}")
+            self._after(SLIDE_FRAME_MS, self._slide_step)
         except tk.TclError:
             self._peek_animating = False
             self.peek_visible = False
@@ -1804,37 +2344,72 @@ class OverlayApp:
         """Called when slide-in animation finishes."""
         self._peek_animating = False
         self.peek_visible = True
+        # Drop a poll left over from the previous peek before starting this one.
+        pending = getattr(self, "_peek_poll_id", None)
+        if pending is not None:
+            self._after_ids.discard(pending)
+            try:
+                self.root.after_cancel(pending)
+            except tk.TclError:
+                pass
+        self._overlay_rect = None
+        self._peek_stay_pt = None
         self._peek_check_mouse()
 
+    def _on_root_configure(self, event):
+        # Bound on the toplevel, so Configure events of child widgets land here too.
+        if event.widget is self.root:
+            self._overlay_rect = None
+            self._peek_stay_pt = None
+
     def _peek_check_mouse(self):
         """Poll mouse position — hide when cursor leaves overlay and trigger."""
+        self._peek_poll_id = None  # this tick has fired
         if not self.running or not self.peek_visible or self._peek_animating:
             return
 
         pt = POINT()
         user32.GetCursorPos(ctypes.byref(pt))
         mx, my = pt.x, pt.y
-
-        # Check if mouse is over the overlay
-        try:
-            ox = self.root.winfo_rootx()
-            oy = self.root.winfo_rooty()
-            ow = self.root.winfo_width()
-            oh = self.root.winfo_height()
-        except tk.TclError:
+        if (mx, my) == getattr(self, "_peek_stay_pt", None):
+            # Neither the cursor nor the overlay moved since the last "stay" decision.
+            self._peek_poll_id = self._after(200, self._peek_check_mouse)
             return
+
+        # Check if mouse is over the overlay (rect cached until the next <Configure>)
+        rect = getattr(self, "_overlay_rect", None)
+        if rect is None:
+            try:
+                rect = (
+                    self.root.winfo_rootx(),
+                    self.root.winfo_rooty(),
+                    self.root.winfo_width(),
+                    self.root.winfo_height(),
+                )
+            except tk.TclError:
+                return
+            self._overlay_rect = rect
+        ox, oy, ow, oh = rect
         over_overlay = ox <= mx <= ox + ow and oy <= my <= oy + oh
 
         # Check if mouse is over the trigger strip (right edge of virtual screen)
-        virt_x = user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
-        virt_w = user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
+        virt_x, _, virt_w, _ = self._peek_rect()
         over_trigger = mx >= virt_x + virt_w - 10
 
         if over_overlay or over_trigger:
-            self.root.after(200, self._peek_check_mouse)
+            self._peek_stay_pt = (mx, my)
+            self._peek_poll_id = self._after(200, self._peek_check_mouse)
         else:
+            self._peek_stay_pt = None
             self._peek_hide()
 
+    def _peek_rect(self):
+        """Virtual-screen rect captured when the current peek started."""
+        rect = getattr(self, "_peek_screen_rect", None)
+        if rect is None:
+            rect = self._peek_screen_rect = _virtual_screen_rect()
+        return rect
+
     def _peek_hide(self):
         """Slide the overlay back off-screen and re-embed in desktop."""
         if not self.peek_visible or self._peek_animating:
@@ -1843,11 +2418,12 @@ class OverlayApp:
         self._peek_animating = True
         # peek_visible stays True until animation finishes (in _peek_hidden)
 
-        screen_right = user32.GetSystemMetrics(SM_XVIRTUALSCREEN) + user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
+        virt_x, _, virt_w, _ = self._peek_rect()
+        screen_right = virt_x + virt_w
         current_x = self.root.winfo_rootx()
         current_y = self.root.winfo_rooty()
 
-        self._animate_slide(current_x, screen_right, current_y, step=20, callback=self._peek_hidden)
+        self._animate_slide(current_x, screen_right, current_y, callback=self._peek_hidden)
 
     def _peek_hidden(self):
         """Called when slide-out animation finishes."""
@@ -1930,11 +2506,16 @@ class OverlayApp:
         )
 
     def toggle_autostart(self):
-        if is_autostart_enabled():
+        enabled = getattr(self, "_autostart_state", None)
+        if enabled is None:
+            enabled = is_autostart_enabled()
+        if enabled:
             ok, message = disable_autostart()
         else:
             ok, message = enable_autostart()
         if not ok:
+            # State unknown after a failed change; re-query on the next toggle.
+            self._autostart_state = None
             log.warning("Autostart toggle failed: %s", message)
             self._set_menu_label("autostart", "Autostart: ERROR")
             _show_error_message(
@@ -1942,8 +2523,10 @@ class OverlayApp:
                 f"{message}\n\nSee log for details:\n{LOG_PATH}",
             )
             return
+        # Validate once after the change so the cached state reflects the real task.
+        self._autostart_state = is_autostart_enabled()
         self._set_menu_label("autostart",
-            "Autostart: ON" if is_autostart_enabled() else "Autostart: OFF"
+            "Autostart: ON" if self._autostart_state else "Autostart: OFF"
         )
 
     def toggle_alerts(self):
@@ -1966,9 +2549,10 @@ class OverlayApp:
 
     def reset_peaks(self):
         self.peaks = _empty_peak_data()
+        self._rendered_data = None  # recompute peaks on the next tick
         for key in ("detail_peak_temps", "detail_peak_usage"):
             if key in self.rows:
-                self.rows[key].config(text="--", fg="#888888")
+                self._set_label(key, "--", "#888888")
 
     def _flush_config(self):
         """Flush pending config changes to disk (debounced)."""
@@ -1977,8 +2561,18 @@ class OverlayApp:
             return
         self._save_config()
 
-    def _check_alerts(self, data):
-        """Play a warning beep if any value exceeds critical thresholds."""
+    def _flush_drag_config(self):
+        """Deferred end_drag save; never waits behind the fan-calibration flush."""
+        self._drag_save_pending = False
+        if not self.running:
+            return
+        self._save_config()
+
+    def _check_alerts(self, data, disks=None):
+        """Play a warning beep if any value exceeds critical thresholds.
+
+        ``disks`` lets update_ui pass the list it already pulled out of ``data``.
+        """
         if not self.alerts_enabled:
             return
         now = time.time()
@@ -1986,54 +2580,63 @@ class OverlayApp:
             return
 
         alerts = []
-        cpu_temp = data.get("cpu_temp")
-        if cpu_temp is not None and cpu_temp >= self._CRITICAL["cpu_temp"]:
-            alerts.append(f"CPU {cpu_temp}°C")
-
-        gpu_temp = data.get("gpu_temp")
-        if gpu_temp is not None and gpu_temp >= self._CRITICAL["gpu_temp"]:
-            alerts.append(f"GPU {gpu_temp}°C")
-
-        ram_pct = data.get("ram_pct")
-        if ram_pct is not None and ram_pct >= self._CRITICAL["ram_pct"]:
-            alerts.append(f"RAM {ram_pct}%")
-
-        for disk in data.get("disks", []):
-            dtemp = disk.get("temp")
-            if dtemp is not None and dtemp >= self._CRITICAL["disk_temp"]:
-                alerts.append(f"{disk['name']} {dtemp}°C")
-            used = disk.get("used_pct")
-            if used is not None and used >= self._CRITICAL["disk_used"]:
-                alerts.append(f"{disk['name']} {used}%")
+        data_get = data.get
+        for key, threshold, label, unit in self._alert_specs:
+            value = data_get(key)
+            if value is not None and value >= threshold:
+                alerts.append(f"{label} {value}{unit}")
+
+        if disks is None:
+            disks = data_get("disks")
+        if disks:
+            critical = self._CRITICAL
+            disk_temp_max = critical.disk_temp
+            disk_used_max = critical.disk_used
+            for disk in disks:
+                dtemp = disk.get("temp")
+                if dtemp is not None and dtemp >= disk_temp_max:
+                    alerts.append(f"{disk['name']} {dtemp}°C")
+                used = disk.get("used_pct")
+                if used is not None and used >= disk_used_max:
+                    alerts.append(f"{disk['name']} {used}%")
 
         if alerts:
             self._last_alert_time = now
-            # Beep in a thread to avoid blocking UI
-            def _alert_beep():
-                try:
-                    winsound.Beep(1000, 300)
-                    time.sleep(0.15)
-                    winsound.Beep(1000, 300)
-                except Exception:
-                    pass  # No audio device or driver issue
-            threading.Thread(target=_alert_beep, daemon=True).start()
+            # Returns immediately; no thread needed. FALSE just means no audio device.
+            try:
+                winmm.PlaySoundW(self._alert_wav, None, SND_MEMORY | SND_ASYNC | SND_NODEFAULT)
+            except Exception:
+                log.debug("Failed to play alert sound", exc_info=True)
 
     def start_drag(self, event):
         self._drag_x = event.x
         self._drag_y = event.y
         self._dragged = False
+        self._drag_pos = None
 
     def on_drag(self, event):
         self._dragged = True
         # Use winfo_rootx/rooty for screen-absolute coords (correct when embedded in WorkerW)
         x = self.root.winfo_rootx() + event.x - self._drag_x
         y = self.root.winfo_rooty() + event.y - self._drag_y
-        self.root.geometry(f"+{x}+{y}")
+        pos = (x, y)
+        # Track the position in attributes; config is written once in end_drag.
+        self._drag_pos = pos
         if self.peek_visible or self._peek_animating:
-            self._saved_pos = (x, y)
-        else:
-            self.config["x"] = x
-            self.config["y"] = y
+            self._saved_pos = pos
+        # Coalesce motion events: only the latest position is applied, once per idle pass.
+        self._pending_geom = pos
+        if not self._drag_scheduled:
+            self._drag_scheduled = True
+            self._after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_scheduled = False
+        geom = self._pending_geom
+        if geom is None:
+            return
+        self._pending_geom = None
+        self.root.geometry(f"+{geom[0]}+{geom[1]}")
 
     def end_drag(self, _event):
         if not self._dragged:
@@ -2041,6 +2644,14 @@ class OverlayApp:
         # If dragged during peek, persist the new position into config
         if self._saved_pos:
             self.config["x"], self.config["y"] = self._saved_pos
+        elif self._drag_pos is not None:
+            self.config["x"], self.config["y"] = self._drag_pos
+        if time.monotonic() - self._last_config_save < CONFIG_SAVE_DEBOUNCE_SECONDS:
+            # Rapid re-drags: one deferred write picks up the final position.
+            if not self._drag_save_pending:
+                self._drag_save_pending = True
+                self._after(int(CONFIG_SAVE_DEBOUNCE_SECONDS * 1000), self._flush_drag_config)
+            return
         self._save_config()
 
     def show_menu(self, event):
@@ -2048,10 +2659,15 @@ class OverlayApp:
 
     def sensor_loop(self):
         consecutive_errors = 0
+        failed_reads = 0  # backoff step; unlike consecutive_errors, not reset by a reinit
         consecutive_reinit_hints = 0
         _storage_counter = 14  # start at INTERVAL-1 so first cycle updates storage
         _STORAGE_INTERVAL = 15  # update storage every 15 cycles (~30s)
+        sensor_index = _SensorIndex()  # topology cache; rebuilt when self.computer changes
+        # Poll against a monotonic deadline so read time does not stretch the period.
+        next_deadline = time.monotonic()
         while not self._stop_event.is_set():
+            next_deadline += SENSOR_POLL_SECONDS
             try:
                 _storage_counter += 1
                 update_storage = _storage_counter >= _STORAGE_INTERVAL
@@ -2062,16 +2678,26 @@ class OverlayApp:
                         break
                     computer = self.computer
                 # Read sensors outside lock to avoid blocking UI thread
-                data = read_sensors(computer, update_storage=update_storage)
+                data = read_sensors(
+                    computer,
+                    update_storage=update_storage,
+                    index=sensor_index,
+                    update_pool=getattr(self, "_update_pool", None),
+                )
                 warmup = (
                     computer is not None
                     and time.monotonic() - getattr(self, "_sensor_start_time", 0) < SENSOR_WARMUP_SECONDS
                 )
                 if warmup and data.get(SENSOR_REINIT_KEY):
                     data[SENSOR_STATUS_KEY] = SENSOR_STATUS_WARMING_UP
-                with self.lock:
+                # Publish by reference swap: a single attribute store is atomic,
+                # and the sample is never mutated after this point, so the UI
+                # thread reads it without the lock. An equal sample keeps the
+                # previous object so update_ui can skip redraws.
+                if data != getattr(self, "sensor_data", None):
                     self.sensor_data = data
                 consecutive_errors = 0
+                failed_reads = 0
                 if computer is not None and data.get(SENSOR_REINIT_KEY):
                     consecutive_reinit_hints += 1
                     reinit_threshold = 1 if warmup else 3
@@ -2092,10 +2718,10 @@ class OverlayApp:
                     consecutive_reinit_hints = 0
             except Exception as e:
                 consecutive_errors += 1
+                failed_reads += 1
                 consecutive_reinit_hints = 0
                 log.error("Sensor read error: %s", e, exc_info=True)
-                with self.lock:
-                    self.sensor_data = {"error": str(e)}
+                self.sensor_data = {"error": str(e)}
                 # After 3 consecutive failures, try to reinitialize the hardware monitor
                 if consecutive_errors >= 3 and computer is not None:
                     log.warning("Reinitializing hardware monitor after %d errors", consecutive_errors)
@@ -2107,72 +2733,97 @@ class OverlayApp:
                         self.computer = init_hardware_monitor()
                         computer = self.computer
                     consecutive_errors = 0
-            self._stop_event.wait(2)
+                # Back off so a permanently failing sensor stack stops costing a read
+                # every poll; reinits keep their every-3rd-failure rhythm on top, so
+                # they spread out too. Both counters reset on the next good read.
+                backoff = SENSOR_ERROR_BACKOFF_SECONDS[
+                    min(failed_reads, len(SENSOR_ERROR_BACKOFF_SECONDS)) - 1
+                ]
+                next_deadline = time.monotonic() + backoff
+            remaining = next_deadline - time.monotonic()
+            if remaining <= 0:
+                # Fell behind (slow read or resume from sleep): restart the cadence
+                # a full poll from now, so slow reads never run back to back.
+                next_deadline = time.monotonic() + SENSOR_POLL_SECONDS
+                remaining = SENSOR_POLL_SECONDS
+            self._stop_event.wait(remaining)
 
     def update_ui(self):
         if not self.running:
             return
 
-        with self.lock:
-            data = self.sensor_data
+        # Lock-free read: the sensor thread swaps in a new dict, never mutates one,
+        # so the Tk thread never waits behind a sensor read or hardware reinit.
+        data = self.sensor_data
 
         if not data:
-            self.root.after(500, self.update_ui)
+            self._after(500, self.update_ui)
             return
 
         if "error" in data:
             self._set_sensor_status(None)
             self._show_sensor_error()
-            self.root.after(2000, self.update_ui)
+            self._after(2000, self.update_ui)
             return
 
+        if data is self._rendered_data:
+            # Nothing new from the sensor thread; alerts still honour their cooldown.
+            self._check_alerts(data)
+            self._after(UI_POLL_MS, self.update_ui)
+            return
+        self._rendered_data = data
+
         self._set_sensor_status(data.get(SENSOR_STATUS_KEY))
 
         # CPU: temp + clock + load%
         cpu_temp = data.get("cpu_temp")
         cpu_load = data.get("cpu_load")
         cpu_clock = data.get("cpu_clock")
-        self.rows["cpu_temp"].config(
-            text=f"{cpu_temp}°C" if cpu_temp is not None else "--",
-            fg=temp_color(cpu_temp)
+        self._set_label(
+            "cpu_temp",
+            f"{cpu_temp}°C" if cpu_temp is not None else "--",
+            temp_color(cpu_temp),
         )
         if cpu_clock is not None:
             ghz = cpu_clock / 1000
-            self.rows["cpu_clock"].config(text=f"{ghz:.2f}G", fg="#4ade80")
+            self._set_label("cpu_clock", f"{ghz:.2f}G", "#4ade80")
         else:
-            self.rows["cpu_clock"].config(text="", fg="#888888")
-        self.rows["cpu_load"].config(
-            text=f"{cpu_load}%" if cpu_load is not None else "",
-            fg=load_color(cpu_load)
+            self._set_label("cpu_clock", "", "#888888")
+        self._set_label(
+            "cpu_load",
+            f"{cpu_load}%" if cpu_load is not None else "",
+            load_color(cpu_load),
         )
 
         # GPU: temp + clock + load%
         gpu_temp = data.get("gpu_temp")
         gpu_load = data.get("gpu_load")
         gpu_clock = data.get("gpu_clock")
-        self.rows["gpu_temp"].config(
-            text=f"{gpu_temp}°C" if gpu_temp is not None else "--",
-            fg=temp_color(gpu_temp)
+        self._set_label(
+            "gpu_temp",
+            f"{gpu_temp}°C" if gpu_temp is not None else "--",
+            temp_color(gpu_temp),
         )
         if gpu_clock is not None:
             if gpu_clock >= 1000:
                 ghz = gpu_clock / 1000
-                self.rows["gpu_clock"].config(text=f"{ghz:.2f}G", fg="#4ade80")
+                self._set_label("gpu_clock", f"{ghz:.2f}G", "#4ade80")
             else:
-                self.rows["gpu_clock"].config(text=f"{gpu_clock}M", fg="#4ade80")
+                self._set_label("gpu_clock", f"{gpu_clock}M", "#4ade80")
         else:
-            self.rows["gpu_clock"].config(text="", fg="#888888")
-        self.rows["gpu_load"].config(
-            text=f"{gpu_load}%" if gpu_load is not None else "",
-            fg=load_color(gpu_load)
+            self._set_label("gpu_clock", "", "#888888")
+        self._set_label(
+            "gpu_load",
+            f"{gpu_load}%" if gpu_load is not None else "",
+            load_color(gpu_load),
         )
 
         # VRAM: usage %
         vram_pct = data.get("gpu_vram_pct")
         if vram_pct is not None:
-            self.rows["vram"].config(text=f"{vram_pct}%", fg=load_color(vram_pct))
+            self._set_label("vram", f"{vram_pct}%", load_color(vram_pct))
         else:
-            self.rows["vram"].config(text="--", fg="#888888")
+            self._set_label("vram", "--", "#888888")
 
         # Auto-calibrate fan RPM max from observed values
         _MAX_SANE_RPM = 10000  # reject glitchy outliers above this
@@ -2191,55 +2842,56 @@ class OverlayApp:
             # Debounce: schedule a single save instead of writing every 2 seconds
             if not self._config_save_pending:
                 self._config_save_pending = True
-                self.root.after(30000, self._flush_config)
+                self._after(30000, self._flush_config)
 
         # GPU FAN: prefer %, fallback RPM
         gpu_fan_pct = data.get("gpu_fan_pct")
         if gpu_fan_pct is not None:
             if gpu_fan_pct == 0:
-                self.rows["gpu_fan"].config(text="OFF", fg="#4ade80")
+                self._set_label("gpu_fan", "OFF", "#4ade80")
             else:
-                self.rows["gpu_fan"].config(text=f"{gpu_fan_pct}%", fg=load_color(gpu_fan_pct))
+                self._set_label("gpu_fan", f"{gpu_fan_pct}%", load_color(gpu_fan_pct))
         elif gpu_fan is not None:
             if gpu_fan == 0:
-                self.rows["gpu_fan"].config(text="OFF", fg="#4ade80")
+                self._set_label("gpu_fan", "OFF", "#4ade80")
             else:
                 est_pct = min(100, round(gpu_fan / self._GPU_FAN_MAX_RPM * 100))
-                self.rows["gpu_fan"].config(text=f"~{est_pct}%", fg=load_color(est_pct))
+                self._set_label("gpu_fan", f"~{est_pct}%", load_color(est_pct))
         else:
-            self.rows["gpu_fan"].config(text="--", fg="#888888")
+            self._set_label("gpu_fan", "--", "#888888")
 
         # CPU FAN: show % (same style as GPU fan)
         cpu_fan_pct = data.get("cpu_fan_pct")
         if cpu_fan_pct is not None:
             if cpu_fan_pct == 0:
-                self.rows["cpu_fan"].config(text="OFF", fg="#4ade80")
+                self._set_label("cpu_fan", "OFF", "#4ade80")
             else:
-                self.rows["cpu_fan"].config(text=f"{cpu_fan_pct}%", fg=load_color(cpu_fan_pct))
+                self._set_label("cpu_fan", f"{cpu_fan_pct}%", load_color(cpu_fan_pct))
         elif cpu_fan is not None:
             if cpu_fan == 0:
-                self.rows["cpu_fan"].config(text="OFF", fg="#4ade80")
+                self._set_label("cpu_fan", "OFF", "#4ade80")
             else:
                 est_pct = min(100, round(cpu_fan / self._CPU_FAN_MAX_RPM * 100))
-                self.rows["cpu_fan"].config(text=f"~{est_pct}%", fg=load_color(est_pct))
+                self._set_label("cpu_fan", f"~{est_pct}%", load_color(est_pct))
         else:
-            self.rows["cpu_fan"].config(text="--", fg="#888888")
+            self._set_label("cpu_fan", "--", "#888888")
 
         # RAM: used/total GB + %
         ram_pct = data.get("ram_pct")
         ram_used = data.get("ram_used_gb")
         ram_total = data.get("ram_total_gb")
         if ram_used is not None and ram_total is not None:
-            self.rows["ram_gb"].config(
-                text=f"{ram_used}/{ram_total}G",
-                fg=load_color(ram_pct)
+            self._set_label(
+                "ram_gb",
+                f"{ram_used}/{ram_total}G",
+                load_color(ram_pct),
             )
         else:
-            self.rows["ram_gb"].config(text="--", fg="#888888")
+            self._set_label("ram_gb", "--", "#888888")
         if ram_pct is not None:
-            self.rows["ram_pct"].config(text=f"{ram_pct}%", fg=load_color(ram_pct))
+            self._set_label("ram_pct", f"{ram_pct}%", load_color(ram_pct))
         else:
-            self.rows["ram_pct"].config(text="", fg="#888888")
+            self._set_label("ram_pct", "", "#888888")
 
         # Disks: orange name left, temp + usage% right
         disks = data.get("disks", [])
@@ -2248,18 +2900,26 @@ class OverlayApp:
         # Rebuild disk rows if disk list changed
         disk_rows_changed = disk_names != self._last_disk_names
         if disk_rows_changed:
+            # Rows of the unchanged leading disks stay; only the differing tail is rebuilt.
+            keep = 0
+            for old_name, new_name in zip(self._last_disk_names, disk_names):
+                if old_name != new_name:
+                    break
+                keep += 1
             self._last_disk_names = disk_names
-            # Destroy all children of disk_frame at once (avoids double-destroy)
-            for child in list(self.disk_frame.winfo_children()):
+            # disk_frame holds exactly one row frame per disk, in display order
+            for child in list(self.disk_frame.winfo_children())[keep:]:
                 child.destroy()
-            for key in list(self.disk_labels):
+            for key in self.disk_labels[keep:]:
                 self.rows.pop(key, None)
                 self.rows.pop(key + "_usage", None)
-            self.disk_labels.clear()
-            # Create new rows
-            for idx, disk in enumerate(disks):
+                self._label_state.pop(key, None)
+                self._label_state.pop(key + "_usage", None)
+            del self.disk_labels[keep:]
+            # Create rows for the new tail
+            for idx in range(keep, len(disks)):
                 key = f"disk_{idx}"
-                self._make_disk_row(key, disk["name"], parent=self.disk_frame)
+                self._make_disk_row(key, disks[idx]["name"], parent=self.disk_frame)
                 self.disk_labels.append(key)
             self._clamp_saved_position_to_visible_screen(persist=True)
 
@@ -2269,27 +2929,24 @@ class OverlayApp:
             disk = disks[i]
             dtemp = disk.get("temp")
             if dtemp is not None:
-                self.rows[key].config(text=f"{dtemp}°C", fg=disk_temp_color(dtemp))
+                self._set_label(key, f"{dtemp}°C", disk_temp_color(dtemp))
             else:
-                self.rows[key].config(text="--", fg="#888888")
+                self._set_label(key, "--", "#888888")
             used = disk.get("used_pct")
             if used is not None:
-                self.rows[key + "_usage"].config(text=f"{used}%", fg=disk_usage_color(used))
+                self._set_label(key + "_usage", f"{used}%", disk_usage_color(used))
             else:
-                self.rows[key + "_usage"].config(text="", fg="#888888")
+                self._set_label(key + "_usage", "", "#888888")
 
         _update_peak_values(self.peaks, data)
         for key, text in _detail_row_values(data, self.peaks).items():
             if key in self.rows:
-                self.rows[key].config(
-                    text=text,
-                    fg="#4ade80" if text != "--" else "#888888",
-                )
+                self._set_label(key, text, "#4ade80" if text != "--" else "#888888")
 
         # Check critical thresholds and alert
-        self._check_alerts(data)
+        self._check_alerts(data, disks)
 
-        self.root.after(2000, self.update_ui)
+        self._after(UI_POLL_MS, self.update_ui)
 
     def _show_sensor_error(self):
         for child in list(self.disk_frame.winfo_children()):
@@ -2297,30 +2954,58 @@ class OverlayApp:
         for key in list(self.disk_labels):
             self.rows.pop(key, None)
             self.rows.pop(key + "_usage", None)
+            self._label_state.pop(key, None)
+            self._label_state.pop(key + "_usage", None)
         self.disk_labels.clear()
         self._last_disk_names = []
 
-        for label in self.rows.values():
-            label.config(text="ERR", fg="#f87171")
+        for key in self.rows:
+            self._set_label(key, "ERR", "#f87171")
+
+    def _set_label(self, key, text, fg):
+        """Configure a row label only when its text/color actually changed."""
+        state = (text, fg)
+        if self._label_state.get(key) == state:
+            return
+        self.rows[key].config(text=text, fg=fg)
+        self._label_state[key] = state
+
+    def _after(self, delay_ms, callback):
+        """Schedule ``callback`` via root.after and track its id until it runs.
+
+        Every pending id is kept, so overlapping schedules of one callback
+        (e.g. two embed requests) are all cancelled by quit().
+        """
+        after_id = self.root.after(delay_ms, lambda: self._run_after(after_id, callback))
+        self._after_ids.add(after_id)
+        return after_id
+
+    def _after_idle(self, callback):
+        """root.after_idle counterpart of _after."""
+        after_id = self.root.after_idle(lambda: self._run_after(after_id, callback))
+        self._after_ids.add(after_id)
+        return after_id
+
+    def _run_after(self, after_id, callback):
+        self._after_ids.discard(after_id)
+        callback()
 
     def quit(self):
         self.running = False
         self._stop_event.set()
-        # Cancel all pending after() callbacks to prevent TclError on destroy
-        try:
-            for after_id in list(self.root.tk.call('after', 'info') or ()):
-                try:
-                    self.root.after_cancel(after_id)
-                except Exception:
-                    log.debug("Failed to cancel after callback", exc_info=True)
-        except Exception:
-            log.debug("Failed to enumerate after callbacks", exc_info=True)
+        # Cancel our pending after() callbacks to prevent TclError on destroy
+        for after_id in tuple(self._after_ids):
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                log.debug("Failed to cancel after callback", exc_info=True)
+        self._after_ids.clear()
         # Save desktop position (not peek/animation position)
         if self._saved_pos:
             self.config["x"], self.config["y"] = self._saved_pos
         elif not self.peek_visible and not self._peek_animating and not self.embedded:
             # Only read winfo coordinates when NOT embedded (they are screen-relative)
-            # When embedded, config["x"]/["y"] already track position via on_drag
+            # When embedded, config["x"]/["y"] already track position via end_drag
             self.config["x"] = self.root.winfo_rootx()
             self.config["y"] = self.root.winfo_rooty()
         self.config["peek_enabled"] = self.peek_enabled
@@ -2329,6 +3014,12 @@ class OverlayApp:
         self.config["gpu_fan_max_rpm"] = self._GPU_FAN_MAX_RPM
         self.config["cpu_fan_max_rpm"] = self._CPU_FAN_MAX_RPM
         self._save_config(update_status=False)
+        for hook in getattr(self, "_win_event_hooks", ()):
+            try:
+                user32.UnhookWinEvent(hook)
+            except Exception:
+                log.debug("Failed to remove WinEvent hook", exc_info=True)
+        self._win_event_hooks = ()
         # Destroy trigger window
         try:
             self._trigger.destroy()
@@ -2340,6 +3031,7 @@ class OverlayApp:
             self.sensor_thread.join(timeout=5)
         except Exception:
             log.debug("Failed to join sensor thread", exc_info=True)
+        self._update_pool.shutdown(wait=False, cancel_futures=True)
         # Close hardware monitor only after the sensor thread has stopped using it.
         if self.computer is not None and not self.sensor_thread.is_alive():
             try:
@@ -2358,17 +3050,29 @@ class OverlayApp:
 def kill_previous_instances():
     """Kill any other overlay.py instances matching our script path."""
     my_pid = os.getpid()
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    script_name = os.path.basename(SCRIPT_PATH).lower()
+    # Only pid/name up front: the image name comes from the process snapshot,
+    # while cmdline needs a cross-process read, so it is fetched only for
+    # Python interpreters (python.exe / pythonw.exe / pythonX.Y.exe).
+    for proc in psutil.process_iter(['pid', 'name']):
         try:
             if proc.info['pid'] == my_pid:
                 continue
-            cmdline = proc.info.get('cmdline') or []
+            name = (proc.info.get('name') or '').lower()
+            if not name.startswith('python'):
+                continue
+            cmdline = proc.cmdline() or []
+            # Cheap prefilter: proc.cwd() opens the process, so only ask it of
+            # the few processes that mention our script name at all.
+            candidates = [arg for arg in cmdline if arg and script_name in arg.lower()]
+            if not candidates:
+                continue
             proc_cwd = None
             try:
                 proc_cwd = proc.cwd()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-            if any(is_same_script_invocation(SCRIPT_PATH, arg, proc_cwd) for arg in cmdline):
+            if any(is_same_script_invocation(SCRIPT_PATH, arg, proc_cwd) for arg in candidates):
                 proc.terminate()
                 try:
                     proc.wait(timeout=3)
@@ -3,16 +3,18 @@ Setup script to download direct DLL dependencies and verify the bundled runtime.
 Run this once before using the overlay.
 """
 import argparse
+import concurrent.futures
 import hashlib
 import importlib
-import io
 import json
 import os
 import platform
 import posixpath
 import re
+import shutil
 import ssl
 import sys
+import tempfile
 import zipfile
 import urllib.request
 try:
@@ -29,6 +31,7 @@ _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 _MANIFEST_DLL_RE = re.compile(r"^lib/[^/\\]+\.dll$")
 _SOURCE_TYPES = {"nuget", "bundled-unknown"}
 _SUPPORTED_MACHINES = {"amd64", "x86_64", "x64"}
+_COPY_CHUNK_SIZE = 64 * 1024
 _PREFLIGHT_MODULES = (
     ("psutil", "psutil"),
     ("clr", "pythonnet"),
@@ -327,13 +330,12 @@ def _print_preflight_result(ok, messages):
         print(f"  ERROR: {message}")
 
 
-def _verify_hash(data, filename, expected_hashes):
-    """Verify SHA256 hash of downloaded DLL data. Returns True if OK."""
+def _verify_hash(actual, filename, expected_hashes):
+    """Verify the SHA256 hex digest of an extracted DLL. Returns True if OK."""
     expected = expected_hashes.get(filename)
     if not expected:
         print(f"  WARNING: No expected hash for {filename}, rejecting")
         return False
-    actual = hashlib.sha256(data).hexdigest()
     if actual != expected:
         print(f"  ERROR: {filename} hash mismatch!")
         print(f"    Expected: {expected}")
@@ -352,45 +354,103 @@ def _dll_candidates(all_files, dll_path):
     ]
 
 
-def download_and_extract():
-    os.makedirs(LIB_DIR, exist_ok=True)
+def _remove_partial_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
-    for name, info in PACKAGES.items():
-        print(f"Downloading {name}...")
-        try:
-            req = urllib.request.Request(info["url"], headers={"User-Agent": "Mozilla/5.0"})
-            ssl_ctx = ssl.create_default_context()
-            with urllib.request.urlopen(req, timeout=60, context=ssl_ctx) as resp:
-                data = resp.read()
-        except Exception as e:
-            raise SetupError(f"error downloading {name}: {e}") from e
 
-        print(f"  Extracting DLLs...")
+def _extract_verified_dll(zf, dll_path, expected_hashes):
+    """Stream one package member into lib/, hashing as it is written.
+
+    The DLL is written to a temporary sibling and only moved into place once
+    its SHA256 matches, so a bad download never replaces a good DLL.
+    """
+    out_name = os.path.basename(dll_path)
+    out_path = os.path.join(LIB_DIR, out_name)
+    tmp_path = f"{out_path}.tmp"
+    digest = hashlib.sha256()
+    replaced = False
+    try:
         try:
-            zf = zipfile.ZipFile(io.BytesIO(data))
-        except zipfile.BadZipFile:
-            raise SetupError(f"downloaded package for {name} is not a valid zip file") from None
-        with zf:
-            all_files = zf.namelist()
-            for dll_path in info["dlls"]:
-                if dll_path not in all_files:
-                    candidates = _dll_candidates(all_files, dll_path)
-                    raise SetupError(
-                        f"could not find exact DLL path for {name}: {dll_path}. "
-                        f"Available matching DLLs: {candidates}"
-                    )
-
-                dll_data = zf.read(dll_path)
-                out_name = os.path.basename(dll_path)
-                if not _verify_hash(dll_data, out_name, info.get("sha256", {})):
-                    raise SetupError(f"hash verification failed for {out_name}")
-                out_path = os.path.join(LIB_DIR, out_name)
-                try:
-                    with open(out_path, "wb") as f:
-                        f.write(dll_data)
-                except OSError as e:
-                    raise SetupError(f"error writing {out_name}: {e}") from e
-                print(f"  Extracted: {out_name}")
+            with zf.open(dll_path) as src, open(tmp_path, "wb") as dst:
+                while True:
+                    chunk = src.read(_COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    dst.write(chunk)
+        except (zipfile.BadZipFile, EOFError) as e:
+            # Corrupt or truncated member (e.g. "Bad CRC-32"); not an OSError.
+            raise SetupError(f"corrupt package member {dll_path}: {e}") from e
+        except OSError as e:
+            raise SetupError(f"error writing {out_name}: {e}") from e
+        if not _verify_hash(digest.hexdigest(), out_name, expected_hashes):
+            raise SetupError(f"hash verification failed for {out_name}")
+        try:
+            os.replace(tmp_path, out_path)
+        except OSError as e:
+            raise SetupError(f"error writing {out_name}: {e}") from e
+        replaced = True
+    finally:
+        if not replaced:
+            _remove_partial_file(tmp_path)
+    print(f"  Extracted: {out_name}")
+
+
+def _download_package(name, info):
+    """Spool one package to an anonymous temp file (never held in memory whole)."""
+    package_file = tempfile.TemporaryFile()
+    try:
+        req = urllib.request.Request(info["url"], headers={"User-Agent": "Mozilla/5.0"})
+        ssl_ctx = ssl.create_default_context()
+        with urllib.request.urlopen(req, timeout=60, context=ssl_ctx) as resp:
+            shutil.copyfileobj(resp, package_file, _COPY_CHUNK_SIZE)
+    except Exception as e:
+        package_file.close()
+        raise SetupError(f"error downloading {name}: {e}") from e
+    package_file.seek(0)
+    return package_file
+
+
+def _extract_package(name, info, package_file):
+    print(f"Extracting {name} DLLs...")
+    try:
+        zf = zipfile.ZipFile(package_file)
+    except zipfile.BadZipFile:
+        raise SetupError(f"downloaded package for {name} is not a valid zip file") from None
+    with zf:
+        all_files = zf.namelist()
+        members = set(all_files)
+        for dll_path in info["dlls"]:
+            # Exact package paths only; basename matches are diagnostics, never a fallback.
+            if dll_path not in members:
+                candidates = _dll_candidates(all_files, dll_path)
+                raise SetupError(
+                    f"could not find exact DLL path for {name}: {dll_path}. "
+                    f"Available matching DLLs: {candidates}"
+                )
+            _extract_verified_dll(zf, dll_path, info.get("sha256", {}))
+
+
+def download_and_extract():
+    os.makedirs(LIB_DIR, exist_ok=True)
+
+    # Downloads are independent and network-bound, so run them concurrently;
+    # extraction then runs in PACKAGES order so output and errors stay stable.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(PACKAGES))) as pool:
+        downloads = []
+        for name, info in PACKAGES.items():
+            print(f"Downloading {name}...")
+            downloads.append((name, info, pool.submit(_download_package, name, info)))
+    try:
+        for name, info, future in downloads:
+            _extract_package(name, info, future.result())
+    finally:
+        for _name, _info, future in downloads:
+            if future.exception() is None:
+                future.result().close()
 
 
 def main(argv=None):
@@ -369,6 +369,68 @@ class LibManifestTests(unittest.TestCase):
                 with self.assertRaisesRegex(setup.SetupError, "hash verification failed"):
                     setup.download_and_extract()
 
+    def test_download_and_extract_fetches_every_package_before_failing(self):
+        zip_data = _zip_bytes({TEST_PACKAGE_DLL_PATH: TEST_DLL_DATA})
+        requested = []
+
+        def urlopen(req, timeout, context):
+            requested.append(req.full_url)
+            if req.full_url.endswith("broken.nupkg"):
+                raise OSError("network down")
+            return _FakeResponse(zip_data)
+
+        with self._patched_download_setup() as lib_dir:
+            packages = {
+                "Broken": {"url": "https://example.invalid/broken.nupkg", "dlls": [], "sha256": {}},
+                "TestPackage": {
+                    "url": "https://example.invalid/test.nupkg",
+                    "dlls": [TEST_PACKAGE_DLL_PATH],
+                    "sha256": {TEST_DLL_NAME: hashlib.sha256(TEST_DLL_DATA).hexdigest()},
+                },
+            }
+            with (
+                mock.patch.object(setup, "PACKAGES", packages),
+                mock.patch.object(setup.urllib.request, "urlopen", side_effect=urlopen),
+                mock.patch("builtins.print"),
+            ):
+                with self.assertRaisesRegex(setup.SetupError, "error downloading Broken: network down"):
+                    setup.download_and_extract()
+
+            self.assertEqual(sorted(requested), [packages["Broken"]["url"], packages["TestPackage"]["url"]])
+            self.assertEqual(os.listdir(lib_dir), [])
+
+    def test_download_and_extract_hash_mismatch_keeps_existing_dll(self):
+        zip_data = _zip_bytes({TEST_PACKAGE_DLL_PATH: b"bad"})
+
+        with self._patched_download_setup(response_data=zip_data) as lib_dir:
+            existing_path = os.path.join(lib_dir, TEST_DLL_NAME)
+            with open(existing_path, "wb") as f:
+                f.write(TEST_DLL_DATA)
+            with mock.patch("builtins.print"):
+                with self.assertRaisesRegex(setup.SetupError, "hash verification failed"):
+                    setup.download_and_extract()
+
+            with open(existing_path, "rb") as f:
+                self.assertEqual(f.read(), TEST_DLL_DATA)
+            self.assertEqual(os.listdir(lib_dir), [TEST_DLL_NAME])
+
+    def test_download_and_extract_reports_corrupt_member_and_removes_tmp_file(self):
+        zip_data = _zip_bytes({TEST_PACKAGE_DLL_PATH: TEST_DLL_DATA})
+
+        with self._patched_download_setup(response_data=zip_data) as lib_dir:
+            with (
+                mock.patch.object(
+                    setup.zipfile.ZipExtFile,
+                    "read",
+                    side_effect=setup.zipfile.BadZipFile("Bad CRC-32 for file"),
+                ),
+                mock.patch("builtins.print"),
+            ):
+                with self.assertRaisesRegex(setup.SetupError, "corrupt package member .*Bad CRC-32"):
+                    setup.download_and_extract()
+
+            self.assertEqual(os.listdir(lib_dir), [])
+
     def test_download_and_extract_raises_on_write_failure(self):
         zip_data = _zip_bytes({TEST_PACKAGE_DLL_PATH: TEST_DLL_DATA})
 
@@ -443,7 +505,7 @@ def _zip_bytes(files):
 
 class _FakeResponse:
     def __init__(self, data):
-        self._data = data
+        self._stream = io.BytesIO(data)
 
     def __enter__(self):
         return self
@@ -451,8 +513,8 @@ class _FakeResponse:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def read(self):
-        return self._data
+    def read(self, size=-1):
+        return self._stream.read(size)
 
 
 class _PatchContext:
@@ -1,3 +1,5 @@
+import concurrent.futures
+import io
 import json
 import math
 import os
@@ -5,6 +7,7 @@ import sys
 import tempfile
 import threading
 import unittest
+import wave
 from types import ModuleType, SimpleNamespace
 from unittest import mock
 
@@ -242,6 +245,28 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(overlay.disk_temp_color(54), "#facc15")
         self.assertEqual(overlay.disk_temp_color(55), "#f87171")
 
+    def test_make_alert_wav_builds_two_beeps_with_silent_gap(self):
+        data = overlay._make_alert_wav(freq=1000, tone_ms=300, gap_ms=150, reps=2, rate=8000)
+
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            self.assertEqual(wav.getnchannels(), 1)
+            self.assertEqual(wav.getsampwidth(), 1)
+            self.assertEqual(wav.getframerate(), 8000)
+            frames = wav.readframes(wav.getnframes())
+
+        self.assertEqual(len(frames), 2400 + 1200 + 2400)
+        self.assertEqual(set(frames[2400:3600]), {0x80})
+        self.assertGreater(max(frames[:2400]), 0xC0)
+
+    def test_color_luts_match_threshold_comparisons_for_any_value(self):
+        for value in (-5, 0, 49, 49.6, 50, 79, 80, 100, 150, 151, 400):
+            expected = "#4ade80" if value < 50 else "#facc15" if value < 80 else "#f87171"
+            self.assertEqual(overlay.load_color(value), expected, value)
+        self.assertEqual(overlay.temp_color(74), "#facc15")
+        self.assertEqual(overlay.temp_color(75.0), "#f87171")
+        self.assertEqual(overlay.disk_usage_color(84), "#facc15")
+        self.assertEqual(overlay.load_color(None), "#888888")
+
     def test_runtime_dll_errors_uses_manifest_verifier_and_allows_extra_dlls(self):
         with mock.patch("setup.verify_lib_manifest", return_value=(False, ["hash mismatch"])) as verify:
             self.assertEqual(
@@ -280,12 +305,38 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertFalse(overlay.is_same_script_invocation(script_path, "overlay.py", os.path.dirname(self._tmpdir.name)))
         self.assertFalse(overlay.is_same_script_invocation(script_path, "other.py", self._tmpdir.name))
 
+    def test_kill_previous_instances_only_queries_cwd_of_candidate_processes(self):
+        script_path = os.path.join(self._tmpdir.name, "overlay.py")
+        unrelated = mock.Mock(info={"pid": 11, "name": "explorer.exe"})
+        unrelated.cmdline.side_effect = AssertionError("cmdline of non-Python process")
+        other_python = mock.Mock(info={"pid": 13, "name": "python.exe"})
+        other_python.cmdline.return_value = ["python.exe", "other.py"]
+        other_python.cwd.side_effect = AssertionError("cwd of unrelated process")
+        previous = mock.Mock(info={"pid": 12, "name": "pythonw.exe"})
+        previous.cmdline.return_value = ["pythonw.exe", "-u", "overlay.py"]
+        previous.cwd.return_value = self._tmpdir.name
+
+        with (
+            mock.patch.object(overlay, "SCRIPT_PATH", script_path),
+            mock.patch.object(overlay.psutil, "process_iter", return_value=[unrelated, other_python, previous]) as process_iter,
+        ):
+            overlay.kill_previous_instances()
+
+        process_iter.assert_called_once_with(["pid", "name"])
+        unrelated.cmdline.assert_not_called()
+        unrelated.terminate.assert_not_called()
+        other_python.cwd.assert_not_called()
+        other_python.terminate.assert_not_called()
+        previous.terminate.assert_called_once_with()
+        previous.wait.assert_called_once_with(timeout=3)
+
     def test_sensor_error_update_shows_error_state_and_clears_disk_rows(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
         app.running = True
         app.lock = threading.Lock()
         app.sensor_data = {"error": "boom"}
         app.root = _FakeRoot()
+        app._after_ids = set()
         disk_child = _FakeChild()
         app.disk_frame = _FakeFrame([disk_child])
         app.disk_labels = ["disk_0"]
@@ -296,6 +347,7 @@ class OverlayHelperTests(unittest.TestCase):
             "disk_0": _FakeLabel(),
             "disk_0_usage": _FakeLabel(),
         }
+        app._label_state = {}
 
         app.update_ui()
 
@@ -306,7 +358,7 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertNotIn("disk_0_usage", app.rows)
         self.assertEqual(app.rows["cpu_temp"].options, {"text": "ERR", "fg": "#f87171"})
         self.assertEqual(app.rows["cpu_load"].options, {"text": "ERR", "fg": "#f87171"})
-        self.assertEqual(app.root.after_calls, [(2000, app.update_ui)])
+        self.assertEqual([delay for delay, _callback in app.root.after_calls], [2000])
 
     def test_get_log_path_prefers_local_appdata(self):
         env = {"LOCALAPPDATA": os.path.join(self._tmpdir.name, "LocalAppData")}
@@ -388,6 +440,22 @@ class OverlayHelperTests(unittest.TestCase):
         with mock.patch.object(overlay, "_run_schtasks", return_value=(result, None)):
             self.assertFalse(overlay.is_autostart_enabled())
 
+    def test_delete_legacy_autostart_value_opens_run_key_once_after_success(self):
+        with (
+            mock.patch.object(overlay, "_legacy_autostart_cleared", False),
+            mock.patch.object(overlay.winreg, "OpenKey", side_effect=[OSError("denied"), mock.MagicMock()]) as open_key,
+            mock.patch.object(overlay.winreg, "DeleteValue") as delete_value,
+        ):
+            first = overlay._delete_legacy_autostart_value()
+            second = overlay._delete_legacy_autostart_value()
+            third = overlay._delete_legacy_autostart_value()
+
+        self.assertFalse(first[0])
+        self.assertEqual(second, (True, "legacy registry entry removed"))
+        self.assertTrue(third[0])
+        self.assertEqual(open_key.call_count, 2)
+        delete_value.assert_called_once()
+
     def test_enable_autostart_keeps_legacy_registry_on_create_failure(self):
         result = _completed(returncode=1, stderr=b"create failed")
         with (
@@ -417,31 +485,52 @@ class OverlayHelperTests(unittest.TestCase):
 
     def test_toggle_autostart_failed_enable_shows_error_and_marks_menu(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app._autostart_state = False
         app.menu_labels = []
         app._set_menu_label = lambda key, label: app.menu_labels.append((key, label))
         with (
-            mock.patch.object(overlay, "is_autostart_enabled", return_value=False),
+            mock.patch.object(overlay, "is_autostart_enabled", return_value=False) as is_enabled,
             mock.patch.object(overlay, "enable_autostart", return_value=(False, "create failed")),
             mock.patch.object(overlay, "_show_error_message") as show_error,
         ):
             app.toggle_autostart()
 
+        is_enabled.assert_not_called()
+        self.assertIsNone(app._autostart_state)
         self.assertEqual(app.menu_labels, [("autostart", "Autostart: ERROR")])
         show_error.assert_called_once()
         self.assertIn("create failed", show_error.call_args.args[1])
 
     def test_toggle_autostart_success_updates_menu_from_validated_state(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app._autostart_state = False
         app.menu_labels = []
         app._set_menu_label = lambda key, label: app.menu_labels.append((key, label))
         with (
-            mock.patch.object(overlay, "is_autostart_enabled", side_effect=[False, True]),
+            mock.patch.object(overlay, "is_autostart_enabled", return_value=True) as is_enabled,
             mock.patch.object(overlay, "enable_autostart", return_value=(True, "Autostart enabled")),
         ):
             app.toggle_autostart()
 
+        is_enabled.assert_called_once_with()
+        self.assertTrue(app._autostart_state)
         self.assertEqual(app.menu_labels, [("autostart", "Autostart: ON")])
 
+    def test_toggle_autostart_queries_task_when_state_is_unknown(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app._autostart_state = None
+        app.menu_labels = []
+        app._set_menu_label = lambda key, label: app.menu_labels.append((key, label))
+        with (
+            mock.patch.object(overlay, "is_autostart_enabled", side_effect=[True, False]),
+            mock.patch.object(overlay, "disable_autostart", return_value=(True, "Autostart disabled")) as disable,
+        ):
+            app.toggle_autostart()
+
+        disable.assert_called_once_with()
+        self.assertFalse(app._autostart_state)
+        self.assertEqual(app.menu_labels, [("autostart", "Autostart: OFF")])
+
     def test_read_sensors_without_computer_returns_psutil_fallback(self):
         with (
             mock.patch.object(overlay.psutil, "cpu_percent", return_value=42.4),
@@ -456,6 +545,44 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(data["disks"], [])
         self.assertEqual(data[overlay.SENSOR_STATUS_KEY], overlay.SENSOR_STATUS_PSUTIL_FALLBACK)
 
+    def test_read_sensors_returns_independent_samples(self):
+        with (
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=12),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=30, used_gb=3, total_gb=10)),
+        ):
+            first = overlay.read_sensors(None)
+            second = overlay.read_sensors(None)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first["disks"], second["disks"])
+        self.assertIsNot(first["motherboard_temps"], second["motherboard_temps"])
+        self.assertIsNone(overlay._SENSOR_DATA_TEMPLATE["disks"])
+
+    def test_psutil_fallbacks_do_not_block_and_sample_memory_once(self):
+        with (
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=12) as cpu_percent,
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=30, used_gb=3, total_gb=10)) as virtual_memory,
+        ):
+            data = overlay.read_sensors(None)
+
+        cpu_percent.assert_called_once_with(interval=0)
+        virtual_memory.assert_called_once_with()
+        self.assertEqual(data["cpu_load"], 12)
+        self.assertEqual(data["ram_pct"], 30)
+
+    def test_lhm_kinds_resolves_enum_members_once_per_enum_types(self):
+        _modules, HardwareType, SensorType = _fake_lhm_modules()
+
+        kinds = overlay._lhm_kinds(HardwareType, SensorType)
+
+        self.assertIs(overlay._lhm_kinds(HardwareType, SensorType), kinds)
+        self.assertEqual(kinds.cpu, "Cpu")
+        self.assertEqual(kinds.gpus, ("GpuAmd", "GpuNvidia", "GpuIntel"))
+        self.assertEqual(kinds.small_data, "SmallData")
+
+        _modules, OtherHardwareType, OtherSensorType = _fake_lhm_modules()
+        self.assertIsNot(overlay._lhm_kinds(OtherHardwareType, OtherSensorType), kinds)
+
     def test_read_sensors_skips_failing_hardware_and_keeps_partial_sample(self):
         modules, HardwareType, SensorType = _fake_lhm_modules()
         bad_cpu = _FakeHardware("Bad CPU", HardwareType.Cpu, update_error=RuntimeError("driver timeout"))
@@ -627,6 +754,35 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(data["gpu_vram_total_gb"], 16.0)
         self.assertEqual(data["ram_pct"], 77)
 
+    def test_sensor_handles_fetch_and_lower_each_name_once(self):
+        class _CountingSensor:
+            SensorType = "Fan"
+            name_reads = 0
+
+            @property
+            def Name(self):
+                _CountingSensor.name_reads += 1
+                return "CPU_Fan #1"
+
+        handles = overlay._sensor_handles([_CountingSensor()])
+
+        self.assertEqual(_CountingSensor.name_reads, 1)
+        self.assertEqual(handles[0][1:], ("Fan", "CPU_Fan #1", "cpu_fan #1"))
+        self.assertIs(overlay._normalized_sensor_name("GPU_Core"), overlay._normalized_sensor_name("GPU_Core"))
+
+    def test_disk_display_name_strips_vendor_prefix(self):
+        self.assertEqual(overlay._disk_display_name("Samsung SSD 980 PRO 1TB"), "980 PRO 1TB")
+        self.assertEqual(overlay._disk_display_name("wdc WD40EFRX"), "WD40EFRX")
+        self.assertEqual(overlay._disk_display_name("Samsung"), "Samsung")
+        self.assertEqual(overlay._disk_display_name("Generic USB Disk"), "Generic USB Disk")
+
+    def test_gpu_memory_role_ignores_shared_memory_variants(self):
+        self.assertEqual(overlay._gpu_memory_role("GPU Memory Used"), "used")
+        self.assertEqual(overlay._gpu_memory_role("D3D Dedicated Memory Used"), "used")
+        self.assertEqual(overlay._gpu_memory_role("GPU_Memory_Total"), "total")
+        self.assertIsNone(overlay._gpu_memory_role("D3D Shared Memory Used"))
+        self.assertIsNone(overlay._gpu_memory_role("GPU Memory Free"))
+
     def test_read_sensors_marks_empty_gpu_hardware_for_reinit(self):
         modules, HardwareType, _SensorType = _fake_lhm_modules()
         gpu = _FakeHardware("AMD Radeon RX 7900 XT", HardwareType.GpuAmd)
@@ -664,6 +820,124 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertIsNone(data["cpu_clock"])
         self.assertEqual(data["cpu_load"], 35)
 
+    def test_read_sensors_update_pool_updates_independent_hardware_once(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        cpu = _FakeHardware(
+            "CPU",
+            HardwareType.Cpu,
+            sensors=[_FakeSensor("CPU Package", SensorType.Temperature, 50)],
+            sub_hardware=[_FakeHardware("CCD", HardwareType.Cpu)],
+        )
+        discrete_gpu = _FakeHardware(
+            "NVIDIA GPU",
+            HardwareType.GpuNvidia,
+            sensors=[_FakeSensor("GPU Core", SensorType.Temperature, 60)],
+        )
+        intel_gpu = _FakeHardware("Intel GPU", HardwareType.GpuIntel, update_error=RuntimeError("should skip"))
+        disk = _FakeHardware("Disk", HardwareType.Storage, sensors=[_FakeSensor("Temperature", SensorType.Temperature, 35)])
+        broken = _FakeHardware("Memory", HardwareType.Memory, update_error=RuntimeError("smbus timeout"))
+        computer = SimpleNamespace(Hardware=[cpu, discrete_gpu, intel_gpu, disk, broken])
+
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool,
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+            self.assertLogs("HeatMap", level="WARNING") as logs,
+        ):
+            data = overlay.read_sensors(computer, update_storage=False, update_pool=pool)
+
+        self.assertEqual(cpu.update_calls, 1)
+        self.assertEqual(cpu.SubHardware[0].update_calls, 1)
+        self.assertEqual(discrete_gpu.update_calls, 1)
+        self.assertEqual(intel_gpu.update_calls, 0)
+        self.assertEqual(disk.update_calls, 0)
+        self.assertEqual(broken.update_calls, 1)
+        self.assertEqual((data["cpu_temp"], data["gpu_temp"]), (50, 60))
+        self.assertEqual(data["disks"][0]["temp"], 35)
+        self.assertEqual(data[overlay.SENSOR_STATUS_KEY], overlay.SENSOR_STATUS_PARTIAL)
+        self.assertTrue(any("smbus timeout" in message for message in logs.output))
+
+    def test_read_sensors_skips_value_reads_that_cannot_change_the_sample(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        cpu = _FakeHardware(
+            "CPU",
+            HardwareType.Cpu,
+            sensors=[
+                _FakeSensor("CPU Package", SensorType.Temperature, 55),
+                _FakeSensor("Core #1", SensorType.Temperature, RuntimeError("not needed")),
+            ],
+        )
+        disk = _FakeHardware(
+            "Disk",
+            HardwareType.Storage,
+            sensors=[
+                _FakeSensor("Life", SensorType.Level, 97),
+                _FakeSensor("Percentage Used", SensorType.Level, RuntimeError("not needed")),
+                _FakeSensor("Available Spare", SensorType.Level, RuntimeError("not needed")),
+            ],
+        )
+        computer = SimpleNamespace(Hardware=[cpu, disk])
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            data = overlay.read_sensors(computer)
+
+        self.assertEqual(data["cpu_temp"], 55)
+        self.assertEqual(data["disks"][0]["life_pct"], 97)
+        self.assertNotIn(overlay.SENSOR_STATUS_KEY, data)
+
+    def test_read_sensors_never_reads_sensors_outside_the_cpu_gpu_plan(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        cpu_temp = _FakeSensor("Core (Tctl/Tdie)", SensorType.Temperature, 61)
+        cpu = _FakeHardware(
+            "CPU",
+            HardwareType.Cpu,
+            sensors=[
+                _FakeSensor("CPU Core #1", SensorType.Load, RuntimeError("per-core load")),
+                _FakeSensor("CPU Total", SensorType.Load, 33),
+                _FakeSensor("Bus Speed", SensorType.Clock, RuntimeError("bus clock")),
+                _FakeSensor("Core #1", SensorType.Clock, 4200),
+                cpu_temp,
+            ],
+        )
+        gpu = _FakeHardware(
+            "NVIDIA GPU",
+            HardwareType.GpuNvidia,
+            sensors=[
+                _FakeSensor("GPU Hot Spot", SensorType.Temperature, 70),
+                _FakeSensor("Memory Junction", SensorType.Temperature, RuntimeError("junction")),
+                _FakeSensor("GPU Memory", SensorType.Load, RuntimeError("memory load")),
+                _FakeSensor("GPU Core", SensorType.Load, 90),
+                _FakeSensor("GPU Memory", SensorType.Clock, RuntimeError("memory clock")),
+                _FakeSensor("GPU Shared Memory Used", SensorType.SmallData, RuntimeError("shared")),
+                _FakeSensor("GPU Memory Used", SensorType.SmallData, 2048),
+                _FakeSensor("GPU Memory Total", SensorType.SmallData, 8192),
+            ],
+        )
+        computer = SimpleNamespace(Hardware=[cpu, gpu])
+        index = overlay._SensorIndex()
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            first = overlay.read_sensors(computer, index=index)
+            cpu_temp._value = 64
+            second = overlay.read_sensors(computer, index=index)
+
+        self.assertEqual(
+            (first["cpu_temp"], first["cpu_load"], first["cpu_clock"]),
+            (61, 33, 4200),
+        )
+        self.assertEqual((first["gpu_temp"], first["gpu_load"], first["gpu_vram_pct"]), (70, 90, 25))
+        self.assertEqual(second["cpu_temp"], 64)
+        self.assertNotIn(overlay.SENSOR_STATUS_KEY, second)
+
     def test_read_sensors_skips_intel_igpu_before_update_when_discrete_gpu_exists(self):
         modules, HardwareType, SensorType = _fake_lhm_modules()
         discrete_gpu = _FakeHardware(
@@ -685,6 +959,144 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(intel_gpu.update_calls, 0)
         self.assertNotIn(overlay.SENSOR_STATUS_KEY, data)
 
+    def test_read_sensors_does_not_update_unread_hardware_types(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        network = _FakeHardware(
+            "Ethernet",
+            "Network",
+            sensors=[_FakeSensor("Data Uploaded", "Data", 12.5)],
+            update_error=RuntimeError("should skip"),
+        )
+        memory = _FakeHardware(
+            "Memory",
+            HardwareType.Memory,
+            sensors=[_FakeSensor("Memory", SensorType.Load, 61)],
+        )
+        computer = SimpleNamespace(Hardware=[network, memory])
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            data = overlay.read_sensors(computer)
+
+        self.assertEqual(network.update_calls, 0)
+        self.assertEqual(memory.update_calls, 1)
+        self.assertEqual(data["ram_pct"], 61)
+        self.assertNotIn(overlay.SENSOR_STATUS_KEY, data)
+
+    def test_sensor_index_rebuilds_after_lhm_hardware_change_event(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        memory = _FakeHardware("Memory", HardwareType.Memory, sensors=[_FakeSensor("Memory", SensorType.Load, 61)])
+        computer = SimpleNamespace(Hardware=[memory], HardwareAdded=_FakeEvent(), HardwareRemoved=_FakeEvent())
+        index = overlay._SensorIndex()
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            overlay.read_sensors(computer, index=index)
+            cached = index.get(computer)
+            disk = _FakeHardware("Disk", HardwareType.Storage)
+            computer.Hardware = [memory, disk]
+            computer.HardwareAdded.fire(disk)
+            stale = index.get(computer)
+            data = overlay.read_sensors(computer, index=index)
+
+        self.assertIsNotNone(cached)
+        self.assertIsNone(stale)
+        self.assertEqual([d["name"] for d in data["disks"]], ["Disk"])
+        self.assertEqual(len(computer.HardwareAdded.handlers), 1)
+        self.assertEqual(len(computer.HardwareRemoved.handlers), 1)
+
+    def test_read_sensors_picks_up_sensor_activated_after_first_update(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        superio = _FakeHardware("Nuvoton", "SuperIO")
+        motherboard = _FakeHardware("Board", HardwareType.Motherboard, sub_hardware=[superio])
+        for hw in (motherboard, superio):
+            hw.SensorAdded = _FakeEvent()
+            hw.SensorRemoved = _FakeEvent()
+        computer = SimpleNamespace(Hardware=[motherboard])
+        index = overlay._SensorIndex()
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            first = overlay.read_sensors(computer, index=index)
+            fan = _FakeSensor("CPU Fan", SensorType.Fan, 1200)
+            superio.Sensors.append(fan)
+            superio.SensorAdded.fire(fan)
+            second = overlay.read_sensors(computer, index=index)
+            index.entries = None  # topology rebuild re-subscribes the same hardware
+            overlay.read_sensors(computer, index=index)
+
+        self.assertIsNone(first["cpu_fan"])
+        self.assertEqual(second["cpu_fan"], 1200)
+        self.assertEqual(len(superio.SensorAdded.handlers), 1)
+        self.assertEqual(len(motherboard.SensorRemoved.handlers), 1)
+
+    def test_read_sensors_rebuilds_cpu_and_gpu_plans_for_late_sensors(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        cpu = _FakeHardware("CPU", HardwareType.Cpu, sensors=[_FakeSensor("CPU Total", SensorType.Load, 33)])
+        gpu = _FakeHardware("GPU", HardwareType.GpuNvidia, sensors=[_FakeSensor("GPU Core", SensorType.Load, 90)])
+        for hw in (cpu, gpu):
+            hw.SensorAdded = _FakeEvent()
+            hw.SensorRemoved = _FakeEvent()
+        computer = SimpleNamespace(Hardware=[cpu, gpu])
+        index = overlay._SensorIndex()
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            first = overlay.read_sensors(computer, index=index)
+            cpu_entry, gpu_entry = index.entries
+            first_plans = (cpu_entry.plan, gpu_entry.plan)
+            for hw, sensor in (
+                (cpu, _FakeSensor("Core (Tctl/Tdie)", SensorType.Temperature, 65)),
+                (gpu, _FakeSensor("GPU Core", SensorType.Temperature, 71)),
+            ):
+                hw.Sensors.append(sensor)
+                hw.SensorAdded.fire(sensor)
+            second = overlay.read_sensors(computer, index=index)
+
+        self.assertEqual((first["cpu_temp"], first["gpu_temp"]), (None, None))
+        self.assertEqual((second["cpu_temp"], second["gpu_temp"]), (65, 71))
+        self.assertEqual((second["cpu_load"], second["gpu_load"]), (33, 90))
+        self.assertEqual([role for _sensor, role in first_plans[0]], ["load"])
+        self.assertEqual(sorted(role for _sensor, role in cpu_entry.plan), ["load", "temp_preferred"])
+        self.assertEqual(sorted(role for _sensor, role in gpu_entry.plan), ["gpu_load", "gpu_temp"])
+
+    def test_read_sensors_index_reuses_topology_until_computer_changes(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        ram_sensor = _FakeSensor("Memory", SensorType.Load, 61)
+        memory = _FakeHardware("Memory", HardwareType.Memory, sensors=[ram_sensor])
+        computer = SimpleNamespace(Hardware=[memory])
+        index = overlay._SensorIndex()
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            first = overlay.read_sensors(computer, index=index)
+            # Topology changes are invisible until the index expires or the computer changes.
+            computer.Hardware = []
+            memory.Sensors = []
+            ram_sensor._value = 75
+            second = overlay.read_sensors(computer, index=index)
+            third = overlay.read_sensors(SimpleNamespace(Hardware=[]), index=index)
+
+        self.assertEqual(first["ram_pct"], 61)
+        self.assertEqual(second["ram_pct"], 75)
+        self.assertEqual(memory.update_calls, 2)
+        self.assertEqual(third["ram_pct"], 20)
+
     def test_read_sensors_reads_intel_gpu_when_discrete_gpu_has_no_temperature(self):
         modules, HardwareType, SensorType = _fake_lhm_modules()
         discrete_gpu = _FakeHardware(
@@ -931,6 +1343,37 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertTrue(computer.opened)
         self.assertTrue(any("CPU" in message for message in logs.output))
 
+    def test_init_hardware_monitor_adds_dll_reference_once_per_process(self):
+        modules, _HardwareType, _SensorType = _fake_lhm_modules()
+        clr_module = ModuleType("clr")
+        clr_module.AddReference = mock.Mock()
+        computers = [_FakeInitComputer([]), _FakeInitComputer([])]
+        modules["clr"] = clr_module
+        modules["LibreHardwareMonitor.Hardware"].Computer = lambda: computers.pop(0)
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay, "_hw_dll_loaded", False),
+            mock.patch.object(overlay.os.path, "exists", return_value=True),
+        ):
+            first = overlay.init_hardware_monitor()
+            second = overlay.init_hardware_monitor()  # sensor_loop reinit
+
+        self.assertTrue(first.opened)
+        self.assertTrue(second.opened)
+        self.assertIsNot(first, second)
+        clr_module.AddReference.assert_called_once()
+
+    def test_init_hardware_monitor_skips_pythonnet_import_without_dll(self):
+        with (
+            mock.patch.dict(sys.modules, {"clr": None}),
+            mock.patch.object(overlay.os.path, "exists", return_value=False),
+            self.assertNoLogs("HeatMap", level="WARNING"),
+        ):
+            result = overlay.init_hardware_monitor()
+
+        self.assertIsNone(result)
+
     def test_init_hardware_monitor_still_falls_back_when_open_fails(self):
         modules, _HardwareType, _SensorType = _fake_lhm_modules()
         clr_module = ModuleType("clr")
@@ -949,6 +1392,17 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertIsNone(result)
         self.assertTrue(any("Failed to init LibreHardwareMonitor" in message for message in logs.output))
 
+    def test_runtime_status_reconfigures_label_only_when_status_changes(self):
+        app = _status_app()
+
+        app._set_sensor_status(overlay.SENSOR_STATUS_PARTIAL)
+        app._set_sensor_status(overlay.SENSOR_STATUS_PARTIAL)
+        self.assertEqual(app.status_label.config_calls, 1)
+
+        app._set_sensor_status(overlay.SENSOR_STATUS_WARMING_UP)
+        self.assertEqual(app.status_label.config_calls, 2)
+        self.assertEqual(app.status_label.options["text"], overlay.STATUS_TEXT[overlay.SENSOR_STATUS_WARMING_UP])
+
     def test_runtime_status_hides_ok_and_config_priorities_override_sensor_warning(self):
         app = _status_app()
 
@@ -1098,6 +1552,24 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertIn("Hardware: CPU (Cpu)", text)
         self.assertIn("Temperature CPU Package = 58", text)
 
+    def test_build_sensor_diagnostics_updates_hardware_that_polling_skips(self):
+        modules, HardwareType, SensorType = _fake_lhm_modules()
+        uploaded = _FakeSensor("Data Uploaded", "Data", None)
+        network = _FakeHardware("Ethernet", "Network", sensors=[uploaded])
+        network.Update = lambda: setattr(uploaded, "_value", 12.5)
+        computer = SimpleNamespace(Hardware=[network])
+
+        with (
+            mock.patch.dict(sys.modules, modules),
+            mock.patch.object(overlay.psutil, "cpu_percent", return_value=10),
+            mock.patch.object(overlay.psutil, "virtual_memory", return_value=_memory(percent=20, used_gb=2, total_gb=8)),
+        ):
+            data = overlay.read_sensors(computer)
+            self.assertIsNone(uploaded.Value)  # polling path leaves Network alone
+            text = overlay.build_sensor_diagnostics(computer, data, is_admin=True, pawnio_installed=True)
+
+        self.assertIn("Data Data Uploaded = 12.5", text)
+
     def test_update_ui_applies_and_clears_sensor_status(self):
         app = _update_ui_app()
         app.sensor_data = _sample_data(status=overlay.SENSOR_STATUS_PSUTIL_FALLBACK)
@@ -1112,6 +1584,111 @@ class OverlayHelperTests(unittest.TestCase):
 
         self.assertFalse(app.status_label.packed)
 
+    def test_update_ui_reads_snapshot_while_sensor_thread_holds_lock(self):
+        app = _update_ui_app()
+        app.sensor_data = _sample_data()
+
+        with app.lock:  # e.g. hardware monitor reinitializing
+            app.update_ui()
+
+        self.assertEqual(app.rows["cpu_load"].options["text"], "10%")
+
+    def test_update_ui_skips_redraw_for_already_rendered_snapshot(self):
+        app = _update_ui_app()
+        alert_calls = []
+        app._check_alerts = lambda data, disks=None: alert_calls.append(data)
+        data = _sample_data()
+        app.sensor_data = data
+
+        app.update_ui()
+        app.rows["cpu_load"].options.clear()
+        app.update_ui()
+
+        self.assertEqual(app.rows["cpu_load"].options, {})
+        self.assertEqual(alert_calls, [data, data])
+        self.assertEqual([delay for delay, _callback in app.root.after_calls], [overlay.UI_POLL_MS] * 2)
+
+        app.reset_peaks()
+        self.assertIsNone(app._rendered_data)
+        app.update_ui()
+
+        self.assertIs(app._rendered_data, data)
+
+    def test_check_alerts_beeps_only_when_a_threshold_trips(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.alerts_enabled = True
+        app._last_alert_time = 0
+        app._ALERT_COOLDOWN = 60
+        app._alert_wav = b"wav"
+        app._CRITICAL = overlay._AlertThresholds(cpu_temp=85, gpu_temp=90, disk_temp=55, disk_used=90, ram_pct=95)
+        app._alert_specs = (("cpu_temp", 85, "CPU", "°C"), ("ram_pct", 95, "RAM", "%"))
+        calm = dict(_sample_data(), cpu_temp=60, ram_pct=40, disks=[{"name": "C:", "temp": 40, "used_pct": 50}])
+        hot_disk = dict(calm, disks=[{"name": "C:", "temp": 56, "used_pct": 50}])
+
+        with (
+            mock.patch.object(overlay.time, "time", return_value=1000.0),
+            mock.patch.object(overlay.winmm, "PlaySoundW") as play_sound,
+            mock.patch.object(overlay.threading, "Thread") as thread,
+        ):
+            app._check_alerts(calm)
+            play_sound.assert_not_called()
+            app._check_alerts(calm, hot_disk["disks"])  # disks passed in by update_ui
+            app._check_alerts(hot_disk)
+
+        play_sound.assert_called_once_with(
+            b"wav", None, overlay.SND_MEMORY | overlay.SND_ASYNC | overlay.SND_NODEFAULT
+        )
+        thread.assert_not_called()
+        self.assertEqual(app._last_alert_time, 1000.0)
+
+    def test_update_ui_rebuilds_only_disk_rows_after_first_changed_name(self):
+        app = _update_ui_app()
+        app._clamp_saved_position_to_visible_screen = lambda persist=False: False
+        row_frames = []
+
+        def make_disk_row(key, disk_name, parent):
+            row = _FakeChild()
+            row.name = disk_name
+            row_frames.append(row)
+            app.rows[key] = _FakeLabel()
+            app.rows[key + "_usage"] = _FakeLabel()
+
+        app._make_disk_row = make_disk_row
+        app.disk_frame.winfo_children = lambda: [row for row in row_frames if not row.destroyed]
+        disks = [{"name": name, "temp": 40, "used_pct": 50} for name in ("C:", "D:", "E:")]
+        app.sensor_data = dict(_sample_data(), disks=disks)
+        app.update_ui()
+        first_rows = list(row_frames)
+
+        app.sensor_data = dict(_sample_data(), disks=disks[:1] + [{"name": "F:", "temp": 41, "used_pct": 10}])
+        app.update_ui()
+
+        self.assertEqual([row.destroyed for row in first_rows], [False, True, True])
+        self.assertEqual([row.name for row in row_frames[3:]], ["F:"])
+        self.assertEqual(app.disk_labels, ["disk_0", "disk_1"])
+        self.assertNotIn("disk_2", app.rows)
+        self.assertEqual(app.rows["disk_1"].options["text"], "41°C")
+
+    def test_update_ui_skips_label_config_when_value_is_unchanged(self):
+        app = _update_ui_app()
+        app.sensor_data = _sample_data()
+
+        app.update_ui()
+        first_calls = {key: label.config_calls for key, label in app.rows.items()}
+        app.sensor_data = dict(_sample_data(), cpu_load=55)
+        app.update_ui()
+
+        self.assertEqual(first_calls["cpu_load"], 1)
+        self.assertEqual(app.rows["cpu_load"].config_calls, 2)
+        self.assertEqual(app.rows["cpu_load"].options["text"], "55%")
+        for key in ("cpu_temp", "gpu_temp", "vram", "ram_gb"):
+            self.assertEqual(app.rows[key].config_calls, first_calls[key], key)
+
+        app._show_sensor_error()
+
+        self.assertEqual(app.rows["cpu_load"].options["text"], "ERR")
+        self.assertEqual(app.rows["ram_gb"].options["text"], "ERR")
+
     def test_toggle_details_persists_config_and_updates_menu(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
         app.running = True
@@ -1131,6 +1708,49 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(app.menu_labels, [("details", "Details: ON"), ("details", "Details: OFF")])
         self.assertFalse(app.details_frame.packed)
 
+    def test_find_desktop_worker_w_stops_enumerating_after_match(self):
+        visited = []
+
+        def enum_windows(callback, _lparam):
+            for hwnd in (10, 20, 30, 40):
+                visited.append(hwnd)
+                if not callback(hwnd, 0):
+                    return False
+            return True
+
+        def find_window_ex(parent, after, class_name, _title):
+            if class_name == "SHELLDLL_DefView":
+                return 99 if parent == 20 else None
+            return 21 if after == 20 else None
+
+        with (
+            mock.patch.object(overlay, "_WORKERW_CACHE", None),
+            mock.patch.object(overlay.user32, "FindWindowW", return_value=1),
+            mock.patch.object(overlay.user32, "SendMessageTimeoutW", return_value=1),
+            mock.patch.object(overlay.user32, "EnumWindows", side_effect=enum_windows),
+            mock.patch.object(overlay.user32, "FindWindowExW", side_effect=find_window_ex),
+        ):
+            worker_w = overlay.find_desktop_worker_w()
+
+        self.assertEqual(worker_w, 21)
+        self.assertEqual(visited, [10, 20])
+
+    def test_find_desktop_worker_w_reuses_cached_window_while_it_exists(self):
+        with (
+            mock.patch.object(overlay, "_WORKERW_CACHE", 21),
+            mock.patch.object(overlay.user32, "IsWindow", side_effect=[True, False]) as is_window,
+            mock.patch.object(overlay.user32, "FindWindowW", return_value=0) as find_window,
+        ):
+            first = overlay.find_desktop_worker_w()
+            second = overlay.find_desktop_worker_w()
+            cache_after = overlay._WORKERW_CACHE
+
+        self.assertEqual(first, 21)
+        self.assertIsNone(second)
+        self.assertIsNone(cache_after)
+        self.assertEqual(is_window.call_count, 2)
+        find_window.assert_called_once_with("Progman", None)
+
     def test_clamp_saved_position_updates_config_geometry_and_persists_silently(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
         app.config = {"x": 1850, "y": 1000}
@@ -1153,6 +1773,279 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(app.root.geometry_calls, ["+1700+920"])
         self.assertEqual(save_calls, [False])
 
+    def test_get_hwnd_resolves_frame_once(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.root = mock.Mock()
+        app.root.wm_frame.return_value = "0x1a2b"
+
+        self.assertEqual(app._get_hwnd(), 0x1A2B)
+        self.assertEqual(app._get_hwnd(), 0x1A2B)
+
+        app.root.wm_frame.assert_called_once_with()
+        app.root.update_idletasks.assert_called_once_with()
+
+    def test_is_desktop_hwnd_walks_parent_chain_to_desktop_class(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        classes = {10: "SysListView32", 20: "SHELLDLL_DefView", 30: "WorkerW"}
+        parents = {10: 20, 20: 30, 30: 0}
+
+        def get_class_name(hwnd, buffer, size):
+            buffer.value = classes[hwnd]
+            return len(buffer.value)
+
+        with (
+            mock.patch.object(overlay.user32, "GetWindowThreadProcessId", return_value=0),
+            mock.patch.object(overlay.user32, "GetClassName", side_effect=get_class_name) as class_mock,
+            mock.patch.object(overlay.user32, "GetAncestor", side_effect=lambda hwnd, flag: parents[hwnd]),
+        ):
+            self.assertTrue(app._is_desktop_hwnd(10))
+            classes[30] = "Shell_TrayWnd"
+            self.assertFalse(app._is_desktop_hwnd(10))
+
+        self.assertEqual(class_mock.call_count, 6)
+
+    def test_poll_trigger_visibility_hit_tests_only_after_window_events(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.peek_enabled = True
+        app.topmost = False
+        app.peek_visible = False
+        app._peek_animating = False
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app._trigger = _FakeRoot()
+        app._trigger_hidden_for_desktop = False
+        app._is_desktop_at_widget = mock.Mock(return_value=True)
+        with mock.patch.object(overlay.user32, "SetWinEventHook", side_effect=[0x51, 0x52, 0x53]) as set_hook:
+            app._install_desktop_event_hook()
+        on_event = set_hook.call_args.args[3]
+        self.assertEqual(
+            [call.args[:2] for call in set_hook.call_args_list],
+            [(0x03, 0x03), (0x0B, 0x0B), (0x16, 0x17)],  # no capture/menu/scroll/drag events
+        )
+        self.assertEqual(app._win_event_hooks, (0x51, 0x52, 0x53))
+
+        app._poll_trigger_visibility()  # initial check
+        for _ in range(overlay.DESKTOP_RECHECK_TICKS - 1):
+            app._poll_trigger_visibility()
+        self.assertEqual(app._is_desktop_at_widget.call_count, 1)
+        self.assertEqual(app._trigger.withdraw_count, 1)
+
+        on_event(0x51, overlay.EVENT_SYSTEM_FOREGROUND, 0x99, 0, 0, 0, 0)
+        app._poll_trigger_visibility()
+        self.assertEqual(app._is_desktop_at_widget.call_count, 2)
+
+        for _ in range(overlay.DESKTOP_RECHECK_TICKS):
+            app._poll_trigger_visibility()
+        self.assertEqual(app._is_desktop_at_widget.call_count, 3)  # periodic fallback
+
+    def test_peek_check_mouse_uses_rect_captured_at_peek_start(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.peek_visible = True
+        app._peek_animating = False
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app.root.rootx, app.root.rooty = 500, 500
+        app._peek_hide = mock.Mock()
+        app._peek_screen_rect = (-1910, 0, 1920, 1080)  # cursor (0, 0) is on the right edge
+
+        with (
+            mock.patch.object(overlay.user32, "GetCursorPos", return_value=True),
+            mock.patch.object(overlay.user32, "GetSystemMetrics") as metrics,
+        ):
+            app._peek_check_mouse()
+            app._peek_screen_rect = (0, 0, 1920, 1080)
+            app._peek_stay_pt = None  # as at the start of a new peek
+            app._peek_check_mouse()
+
+        metrics.assert_not_called()
+        self.assertEqual([delay for delay, _callback in app.root.after_calls], [200])
+        app._peek_hide.assert_called_once_with()
+
+    def test_animate_slide_positions_by_elapsed_time_and_finishes_on_target(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app._peek_animating = True
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        done = []
+
+        # 200 px at 2000 px/s = 100 ms; a late 70 ms frame lands at the 70 % mark.
+        with mock.patch.object(overlay.time, "perf_counter", side_effect=[10.0, 10.0, 10.07, 10.25]):
+            app._animate_slide(1920, 1720, 300, callback=lambda: done.append(True))
+            while app.root.after_calls:
+                _delay, callback = app.root.after_calls.pop(0)
+                callback()
+
+        self.assertEqual(app.root.geometry_calls, ["+1920+300", "+1780+300", "+1720+300"])
+        self.assertEqual(done, [True])
+
+    def test_peek_check_mouse_reuses_overlay_rect_until_root_configure(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.peek_visible = True
+        app._peek_animating = False
+        app.root = mock.Mock()
+        app._after_ids = set()
+        app.root.winfo_rootx.return_value = -10
+        app.root.winfo_rooty.return_value = -10
+        app.root.winfo_width.return_value = 200
+        app.root.winfo_height.return_value = 120
+        app._peek_screen_rect = (0, 0, 1920, 1080)
+        cursor = {"x": 0}
+
+        def get_cursor_pos(pt_ref):
+            pt_ref._obj.x = cursor["x"]
+            return True
+
+        with mock.patch.object(overlay.user32, "GetCursorPos", side_effect=get_cursor_pos):
+            app._peek_check_mouse()
+            app._peek_check_mouse()  # same cursor point: no hit-test at all
+            cursor["x"] = 5
+            app._peek_check_mouse()  # moved: hit-test against the cached rect
+            self.assertEqual(app.root.winfo_rootx.call_count, 1)
+
+            app._on_root_configure(SimpleNamespace(widget=object()))  # child widget
+            app._peek_check_mouse()
+            self.assertEqual(app.root.winfo_rootx.call_count, 1)
+            app._on_root_configure(SimpleNamespace(widget=app.root))
+            app._peek_check_mouse()
+
+        self.assertEqual(app.root.winfo_rootx.call_count, 2)
+        self.assertEqual(app.root.after.call_count, 5)
+
+    def test_peek_shown_replaces_mouse_poll_left_from_previous_peek(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.peek_visible = False
+        app._peek_animating = True
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app.root.rootx, app.root.rooty = -10, -10  # cursor (0, 0) stays over the overlay
+        app._peek_screen_rect = (0, 0, 1920, 1080)
+        app._peek_poll_id = "after#stale"
+
+        with mock.patch.object(overlay.user32, "GetCursorPos", return_value=True):
+            app._peek_shown()
+
+        self.assertEqual(app.root.cancelled_after_ids, ["after#stale"])
+        self.assertEqual(len(app.root.after_calls), 1)
+        self.assertEqual(app._peek_poll_id, "after#1")
+
+    def test_quit_cancels_every_pending_tracked_after_id(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.root = _FakeRoot()
+        app.root.destroy = mock.Mock()
+        app._after_ids = set()
+        app.update_ui = mock.Mock()
+        app._embed_into_desktop = mock.Mock()
+        app._after(500, app.update_ui)
+        app.root.after_calls[0][1]()  # fired: no longer pending
+        app._after(100, app._embed_into_desktop)  # startup embed...
+        app._after(50, app._embed_into_desktop)  # ...overlapping a _schedule_embed
+        app._drag_scheduled = False
+        app._dragged = False
+        app._drag_x = app._drag_y = 0
+        app.peek_visible = app._peek_animating = False
+        app.on_drag(SimpleNamespace(x=5, y=5))  # coalesced geometry flush is still idle-pending
+        app._stop_event = threading.Event()
+        app._saved_pos = (10, 20)
+        app.config = {}
+        app.peek_enabled = app.alerts_enabled = app.details_enabled = True
+        app._GPU_FAN_MAX_RPM = 2200
+        app._CPU_FAN_MAX_RPM = 1800
+        app._save_config = mock.Mock()
+        app._trigger = mock.Mock()
+        app.sensor_thread = mock.Mock()
+        app._update_pool = mock.Mock()
+        app.computer = None
+
+        app.quit()
+
+        app.update_ui.assert_called_once_with()
+        self.assertEqual(sorted(app.root.cancelled_after_ids), ["after#2", "after#3", "after#4"])
+        self.assertEqual(app._after_ids, set())
+        app.root.destroy.assert_called_once_with()
+
+    def test_poll_screen_change_repositions_only_when_rect_changes(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app._update_trigger_geometry = mock.Mock()
+        app._clamp_saved_position_to_visible_screen = mock.Mock()
+        rect = [0, 0, 1920, 1080]
+        with mock.patch.object(overlay.user32, "GetSystemMetrics", side_effect=lambda key: rect[key - 76]):
+            app._last_screen_rect = overlay._virtual_screen_rect()
+            app._poll_screen_change()
+            app._update_trigger_geometry.assert_not_called()
+
+            rect[2] = 3840
+            app._poll_screen_change()
+
+        self.assertEqual(app._last_screen_rect, (0, 0, 3840, 1080))
+        app._update_trigger_geometry.assert_called_once_with()
+        app._clamp_saved_position_to_visible_screen.assert_called_once_with(persist=True)
+
+    def test_on_drag_coalesces_geometry_updates_until_idle(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.config = {"x": 0, "y": 0}
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app.root.rootx, app.root.rooty = 100, 200
+        app.peek_visible = False
+        app._peek_animating = False
+        app._pending_geom = None
+        app._drag_scheduled = False
+        app.start_drag(SimpleNamespace(x=5, y=5))
+
+        app.on_drag(SimpleNamespace(x=15, y=25))
+        app.on_drag(SimpleNamespace(x=35, y=45))
+
+        self.assertEqual(app.root.geometry_calls, [])
+        self.assertEqual(app.config, {"x": 0, "y": 0})
+        self.assertEqual(app._drag_pos, (130, 240))
+        self.assertEqual(len(app.root.after_calls), 1)
+        delay, callback = app.root.after_calls[0]
+        self.assertEqual(delay, "idle")
+        callback()
+        self.assertEqual(app.root.geometry_calls, ["+130+240"])
+        self.assertFalse(app._drag_scheduled)
+
+    def test_end_drag_defers_save_when_config_was_just_written(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.running = True
+        app.config = {"x": 0, "y": 0}
+        app.root = _FakeRoot()
+        app._after_ids = set()
+        app._dragged = True
+        app._drag_pos = (10, 20)
+        app._saved_pos = None
+        app._config_save_pending = True  # a 30 s fan-calibration flush is already queued
+        app._drag_save_pending = False
+        app._last_config_save = 0.0
+        save_calls = []
+        app._save_config = lambda update_status=True: save_calls.append(dict(app.config))
+
+        with mock.patch.object(overlay.time, "monotonic", return_value=100.0):
+            app.end_drag(None)
+        app._last_config_save = 100.0
+        app._drag_pos = (30, 20)
+        with mock.patch.object(overlay.time, "monotonic", return_value=100.2):
+            app.end_drag(None)
+            app.end_drag(None)
+
+        self.assertEqual(save_calls, [{"x": 10, "y": 20}])
+        self.assertTrue(app._drag_save_pending)
+        self.assertEqual(len(app.root.after_calls), 1)
+        delay, callback = app.root.after_calls[0]
+        self.assertEqual(delay, 500)
+        callback()
+        self.assertEqual(save_calls[-1], {"x": 30, "y": 20})
+        self.assertFalse(app._drag_save_pending)
+        self.assertTrue(app._config_save_pending)  # the fan flush keeps its own timer
+
     def test_toggle_peek_off_restores_saved_position_and_persists_it(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
         app.config = {"peek_enabled": True, "x": 50, "y": 60}
@@ -1162,6 +2055,7 @@ class OverlayHelperTests(unittest.TestCase):
         app._saved_pos = (320, 240)
         app.topmost = False
         app.root = _FakeRoot()
+        app._after_ids = set()
         app._trigger = _FakeRoot()
         app._trigger_hidden_for_desktop = True
         app.menu_labels = []
@@ -1194,6 +2088,7 @@ class OverlayHelperTests(unittest.TestCase):
         app._saved_pos = None
         app.topmost = False
         app.root = _FakeRoot()
+        app._after_ids = set()
         app._trigger = _FakeRoot()
         app._trigger_hidden_for_desktop = True
         app.menu_labels = []
@@ -1224,6 +2119,7 @@ class OverlayHelperTests(unittest.TestCase):
             "detail_peak_temps": _FakeLabel(),
             "detail_peak_usage": _FakeLabel(),
         }
+        app._label_state = {}
 
         app.reset_peaks()
 
@@ -1234,6 +2130,7 @@ class OverlayHelperTests(unittest.TestCase):
     def test_copy_diagnostics_uses_fresh_monitor_and_clipboard(self):
         app = overlay.OverlayApp.__new__(overlay.OverlayApp)
         app.root = _FakeRoot()
+        app._after_ids = set()
         computer = _CloseableComputer()
 
         with (
@@ -1304,6 +2201,61 @@ class OverlayHelperTests(unittest.TestCase):
         self.assertEqual(app.sensor_data[overlay.SENSOR_STATUS_KEY], overlay.SENSOR_STATUS_WARMING_UP)
         self.assertTrue(any("incomplete sensor samples" in message for message in logs.output))
 
+    def test_sensor_loop_backs_off_exponentially_on_repeated_read_errors(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        computers = [_CloseableComputer() for _ in range(4)]
+        app.computer = computers[0]
+        app.running = True
+        app.lock = threading.Lock()
+        app._stop_event = _LoopStopEvent(iterations=10)
+
+        with (
+            mock.patch.object(overlay, "read_sensors", side_effect=RuntimeError("bus gone")),
+            mock.patch.object(overlay, "init_hardware_monitor", side_effect=computers[1:]) as init_monitor,
+            mock.patch.object(overlay.time, "monotonic", return_value=100.0),
+            self.assertLogs("HeatMap", level="WARNING"),
+        ):
+            app.sensor_loop()
+
+        self.assertEqual(app._stop_event.timeouts, [2, 4, 8, 16, 32, 64, 128, 256, 300, 300])
+        # One reinit per 3 consecutive failures (3rd, 6th, 9th), not one per failure.
+        self.assertEqual(init_monitor.call_count, 3)
+        self.assertTrue(all(computer.closed for computer in computers[:3]))
+        self.assertIs(app.computer, computers[3])
+        self.assertEqual(app.sensor_data, {"error": "bus gone"})
+
+    def test_sensor_loop_waits_until_monotonic_deadline(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.computer = None
+        app.running = True
+        app.lock = threading.Lock()
+        app._stop_event = _LoopStopEvent(iterations=3)
+
+        with (
+            mock.patch.object(overlay, "read_sensors", return_value=_sample_data()),
+            mock.patch.object(overlay.time, "monotonic", side_effect=[100.0, 100.5, 102.75, 107.0, 107.0]),
+        ):
+            app.sensor_loop()
+
+        self.assertEqual(app._stop_event.timeouts, [1.5, 1.25, overlay.SENSOR_POLL_SECONDS])
+
+    def test_sensor_loop_waits_a_full_poll_after_an_overrunning_read(self):
+        app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+        app.computer = None
+        app.running = True
+        app.lock = threading.Lock()
+        app._stop_event = _LoopStopEvent(iterations=2)
+
+        with (
+            mock.patch.object(overlay, "read_sensors", return_value=_sample_data()),
+            # start, slow first read ends at 103 (deadline was 102), second read ends at 105.5
+            mock.patch.object(overlay.time, "monotonic", side_effect=[100.0, 103.0, 103.0, 105.5]),
+        ):
+            app.sensor_loop()
+
+        # Full gap after the overrun, then the cadence resumes from the new deadline (107).
+        self.assertEqual(app._stop_event.timeouts, [overlay.SENSOR_POLL_SECONDS, 1.5])
+
     def test_save_config_wrapper_sets_and_clears_config_status(self):
         app = _status_app()
         app.config = {"x": 1}
@@ -1380,8 +2332,10 @@ class _FakeLabel:
         self.options = {}
         self.packed = False
         self.pack_options = {}
+        self.config_calls = 0
 
     def config(self, **kwargs):
+        self.config_calls += 1
         self.options.update(kwargs)
 
     def pack(self, **kwargs):
@@ -1418,9 +2372,26 @@ class _FakeRoot:
         self.attribute_calls = []
         self.withdraw_count = 0
         self.deiconify_count = 0
+        self.rootx = 0
+        self.rooty = 0
+        self.cancelled_after_ids = []
 
     def after(self, delay, callback):
         self.after_calls.append((delay, callback))
+        return f"after#{len(self.after_calls)}"
+
+    def after_cancel(self, after_id):
+        self.cancelled_after_ids.append(after_id)
+
+    def after_idle(self, callback):
+        self.after_calls.append(("idle", callback))
+        return f"after#{len(self.after_calls)}"
+
+    def winfo_rootx(self):
+        return self.rootx
+
+    def winfo_rooty(self):
+        return self.rooty
 
     def geometry(self, spec):
         self.geometry_calls.append(spec)
@@ -1478,6 +2449,23 @@ class _FakeHardware:
             raise self._update_error
 
 
+class _FakeEvent:
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        self.handlers.remove(handler)
+        return self
+
+    def fire(self, *args):
+        for handler in list(self.handlers):
+            handler(*args)
+
+
 class _FailingHardwareComputer:
     def __init__(self, error):
         self._error = error
@@ -1499,11 +2487,13 @@ class _LoopStopEvent:
     def __init__(self, iterations):
         self.iterations = 0
         self.max_iterations = iterations
+        self.timeouts = []
 
     def is_set(self):
         return self.iterations >= self.max_iterations
 
-    def wait(self, _timeout):
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
         self.iterations += 1
         return self.is_set()
 
@@ -1533,6 +2523,7 @@ def _status_app():
     app = overlay.OverlayApp.__new__(overlay.OverlayApp)
     app.running = True
     app.root = _FakeRoot()
+    app._after_ids = set()
     app.status_label = _FakeLabel()
     app._status_label_visible = False
     app._config_status = None
@@ -1560,13 +2551,15 @@ def _update_ui_app():
         "ram_gb": _FakeLabel(),
         "ram_pct": _FakeLabel(),
     }
+    app._label_state = {}
+    app._rendered_data = None
     app._GPU_FAN_MAX_RPM = 2200
     app._CPU_FAN_MAX_RPM = 1800
     app._config_save_pending = False
     app.peaks = overlay._empty_peak_data()
     app.config = {}
     app.alerts_enabled = False
-    app._check_alerts = lambda _data: None
+    app._check_alerts = lambda _data, _disks=None: None
     return app
 
 